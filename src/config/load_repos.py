@@ -99,6 +99,7 @@ def check_types_recursive(ctx: Context, input_value, input_key="", recursed=Fals
     repos_to_convert_fields[ "branches"                     ] = (str, list      )
     repos_to_convert_fields[ "tags"                         ] = (str, list      )
     repos_to_convert_fields[ "log_window_size"              ] = (int,           )
+    repos_to_convert_fields[ "min_remote_recheck_seconds"   ] = (int,           )
     repos_to_convert_fields[ "authors_file_path"            ] = (str,           )
     repos_to_convert_fields[ "authors_prog_path"            ] = (str,           )
     repos_to_convert_fields[ "disable_tls_verification"     ] = (bool, str      )
@@ -3,7 +3,7 @@
 
 # Import repo-converter modules
 from config import load_env, load_repos, validate_env
-from utils import concurrency_manager, fork_conversion_processes, git, logger, signal_handler, status_monitor
+from utils import cmd, concurrency_manager, fork_conversion_processes, git, lockfiles, logger, signal_handler, status_monitor
 from utils.context import Context
 from utils.logging import log
 
@@ -32,6 +32,12 @@ def main():
     # Log the container start event
     log(ctx, f"Starting container; running as resuid {ctx.resuid}", "info", log_env_vars = True)
 
+    # Raise the open files limit, before any child processes are forked, so they all inherit it
+    cmd.raise_open_files_limit(ctx)
+
+    # Delete any invalid repos left in the trash dir by a previous run of the container
+    lockfiles.clear_repo_trash(ctx)
+
     # Register signal handlers for graceful shutdown
     signal_handler.register_signal_handler(ctx)
 
@@ -8,6 +8,10 @@ from utils import cmd, git, lockfiles, logging
 
 # Import Python standard modules
 from datetime import datetime
+from types import MappingProxyType
+from typing import NamedTuple
+import concurrent.futures
+import json
 import os
 import random
 import re
@@ -25,7 +29,7 @@ import pysvn
 
 # dicts for:
     # ctx, including job subdict, for both configs and logging
-    # commands, separate from ctx, as they do not need to be shared / logged
+    # commands, separate from ctx, as they do not need to be shared / logged (a Commands named tuple of lists)
     # Pass information around in these dicts ^, not other return values / dicts / strings / etc.
 
 # Repo states:
@@ -37,6 +41,89 @@ import pysvn
     # Easiest reading / maintenance
     # Fewest local commands
 
+# Repo config keys read from repos-to-convert.yaml, and their default values if they're not provided
+# Built once at import time, instead of on every job
+# Keys with a default value of None are left out of the job config, if they're not provided
+# Read only, so no job can change the defaults for the jobs after it
+# TODO: Move this to a centralized config spec file
+_REPO_CONFIG_DEFAULTS = MappingProxyType({
+
+    # Source repo location
+    "repo_key"                  : None,
+    "repo_url"                  : None,
+
+    # Source repo config
+    "username"                  : None,
+    "password"                  : None,
+    "trunk"                     : None,
+    "branches"                  : None,
+    "tags"                      : None,
+    "log_window_size"           : 100,
+    "max_retries"               : 3,
+    "min_remote_recheck_seconds": 60,
+    "authors_file_path"         : None,
+    "authors_prog_path"         : None,
+    "disable_tls_verification"  : False,
+    "git_ignore_file_path"      : None,
+
+    # Git destination config
+    "local_repo_path"           : None,
+    "bare_clone"                : True,
+    "git_default_branch"        : "trunk",
+})
+
+# git svn fetch retry tuning
+# Smallest log_window_size to halve down to on retries, as git svn misbehaves with a window of 0
+_LOG_WINDOW_SIZE_MIN            = 10
+# Give up early after this many consecutive failed tries without adding any commits
+# Not below the default max_retries, so a default job still gets its last try, with the smallest log_window_size
+_MAX_TRIES_WITHOUT_PROGRESS     = 3
+# Cap on the backoff between retries, in seconds
+_RETRY_DELAY_SECONDS_MAX        = 60
+# Scale the backoff from how long the failed try ran, as a slow failure likely means a busy server
+_RETRY_DELAY_FETCH_DURATION_FACTOR = 1.5
+
+# svn info retry tuning, in seconds
+_SVN_INFO_RETRY_DELAY_SECONDS_BASE  = 0.2
+_SVN_INFO_RETRY_DELAY_SECONDS_MAX   = 10
+# Stop retrying svn info after this long, regardless of max_retries, so a down server can't hold a job slot for long
+_SVN_INFO_RETRY_DEADLINE_SECONDS    = 60
+
+# svn info results are cached in the local repo's .git dir for the repo's min_remote_recheck_seconds,
+# so back to back jobs for the same repo don't each need a round trip to the svn server
+_SVN_INFO_CACHE_FILE            = ".git/.repo_converter_svn_info_cache.json"
+
+# Results of the git commands in _get_local_git_repo_stats are cached in the local repo's .git dir,
+# and reused until the repo's refs or git svn metadata change
+_LOCAL_STATS_CACHE_FILE         = ".git/.repo_converter_stats_cache.json"
+
+# The repo dir size walk is the one local stat which isn't cached on disk,
+# so cache it in memory, for this job's process, for a few seconds,
+# as the success check after the last fetch try and _cleanup both need it, with no changes to the repo in between
+# _git_svn_fetch invalidates it after each fetch try
+_GIT_DIR_SIZE_CACHE_TTL_SECONDS = 10
+_git_dir_size_cache             = {}
+
+
+# Invariant command fragments, built once at import time, unpacked into each job's commands in _build_cli_commands
+_ARGS_GIT_DISABLE_TLS_VERIFICATION  = ("-c", "http.sslVerify=false")
+_ARGS_GIT_GARBAGE_COLLECTION        = ("gc",)
+_ARGS_GIT_SVN_FETCH                 = ("svn", "fetch", "--quiet")
+_ARGS_GIT_SVN_INIT                  = ("svn", "init")
+_ARGS_GIT_SYMBOLIC_REF_HEAD         = ("symbolic-ref", "HEAD")
+
+
+class Commands(NamedTuple):
+    """
+    Repeatable commands for each external CLI, built once per job by _build_cli_commands
+    Each command is a tuple of strings, so they can't be extended in place by mistake
+    """
+
+    git_default_branch:         tuple
+    git_garbage_collection:     tuple
+    git_svn_fetch:              tuple
+    git_svn_init:               tuple
+
 
 def convert(ctx: Context) -> None:
     """
@@ -78,17 +165,23 @@ def convert(ctx: Context) -> None:
     _configure_git_repo(ctx, commands)
 
     # Set the local repo stats into context for the beginning of the job
-    _get_local_git_repo_stats(ctx, "begin")
+    # Skip walking the repo dir for its size until we know we're going to fetch,
+    # as the up to date check only needs the latest commit's rev
+    _get_local_git_repo_stats(ctx, "begin", include_dir_size=False)
 
     # Check if the local repo is already up to date
     if _check_if_repo_up_to_date(ctx):
 
         # If the repo already exists, and is already up to date, then exit early
-        ### EXTERNAL COMMAND: svn log ###
-        _cleanup(ctx)
+        # Skip walking the repo dir for its size at the end too, as nothing was fetched
+        _cleanup(ctx, include_dir_size=False)
         log(ctx, f"Skipping git svn fetch; repo up to date", "info")
         return
 
+    # We're going to fetch, so get the repo's dir size at the beginning of the job
+    # The git probes' results are reused from the stats cache, as the repo hasn't changed since the call above
+    _get_local_git_repo_stats(ctx, "begin")
+
     # Execute the fetch
     ### EXTERNAL COMMAND: git svn fetch ###
     _git_svn_fetch(ctx, commands)
@@ -103,52 +196,32 @@ def _extract_repo_config_and_set_default_values(ctx: Context) -> None:
     """
 
     # Get the repo key from the job context
-    repo_key = ctx.job.get("config",{}).get("repo_key")
+    repo_key = ctx.job["config"].get("repo_key")
 
     # Short name for repo config dict
     repo_config = ctx.repos.get(repo_key)
 
-    # Get config parameters read from repos-to-clone.yaml, and set defaults if they're not provided
-    # TODO: Move this to a centralized config spec file, including setting defaults
-    config = {
-
-        # Source repo location
-        "repo_key"                  : repo_config.get("repo_key",                   None),
-        "repo_url"                  : repo_config.get("repo_url",                   None),
-
-        # Source repo config
-        "username"                  : repo_config.get("username",                   None),
-        "password"                  : repo_config.get("password",                   None),
-        "trunk"                     : repo_config.get("trunk",                      None),
-        "branches"                  : repo_config.get("branches",                   None),
-        "tags"                      : repo_config.get("tags",                       None),
-        "log_window_size"           : repo_config.get("log_window_size",            100 ),
-        "max_retries"               : repo_config.get("max_retries",                3   ),
-        "authors_file_path"         : repo_config.get("authors_file_path",          None),
-        "authors_prog_path"         : repo_config.get("authors_prog_path",          None),
-        "disable_tls_verification"  : repo_config.get("disable_tls_verification",   False),
-        "git_ignore_file_path"      : repo_config.get("git_ignore_file_path",       None),
-
-        # Git destination config
-        "local_repo_path"           : repo_config.get("local_repo_path",            None),
-        "bare_clone"                : repo_config.get("bare_clone",                 True),
-        "git_default_branch"        : repo_config.get("git_default_branch",         "trunk"),
+    # Get config parameters read from repos-to-convert.yaml, and set defaults if they're not provided
+    # Drop any keys which are still None, so they don't overwrite values already in the job config
+    config_output = {
+        key: value
+            for key, default in _REPO_CONFIG_DEFAULTS.items()
+            if (value := repo_config.get(key, default)) is not None
     }
 
     # Update the repo_config in the context with processed values
-    config_output = {k: v for k, v in config.items() if v is not None}
     ctx.job["config"].update(config_output)
     # log(ctx, f"Repo config", "debug")
 
 
-def _build_cli_commands(ctx: Context) -> dict:
+def _build_cli_commands(ctx: Context) -> Commands:
     """
     Build commands for both SVN and Git CLI tools
-    As lists of strings
+    As tuples of strings, in a Commands named tuple
     """
 
     # Get config values
-    job_config                          = ctx.job.get("config",{})
+    job_config                          = ctx.job["config"]
     branches                            = job_config.get("branches")
     disable_tls_verification            = job_config.get("disable_tls_verification")
     git_default_branch                  = job_config.get("git_default_branch")
@@ -159,29 +232,26 @@ def _build_cli_commands(ctx: Context) -> dict:
     username                            = job_config.get("username")
 
 
-    # Common svn command args
-    # Also used to convert strings to lists, to concatenate lists
-    arg_repo_url                        = [repo_url]
-
     # Common git command args
-    arg_git                             = ["git", "-C", local_repo_path]
+    arg_git                             = ("git", "-C", local_repo_path)
 
     if disable_tls_verification:
-        arg_git                         += ["-c", "http.sslVerify=false"]
-
-    arg_git_svn                         = arg_git + ["svn"]
+        arg_git                         += _ARGS_GIT_DISABLE_TLS_VERIFICATION
 
 
     # git commands
-    cmd_git_default_branch              = arg_git     + ["symbolic-ref", "HEAD", f"refs/heads/{git_default_branch}"]
-    cmd_git_garbage_collection          = arg_git     + ["gc"]
-    cmd_git_svn_fetch                   = arg_git_svn + ["fetch", "--quiet"]
-    cmd_git_svn_init                    = arg_git_svn + ["init"] + arg_repo_url
+    # Each is built in a single tuple display, from the prebuilt fragments
+    cmd_git_default_branch              = (*arg_git, *_ARGS_GIT_SYMBOLIC_REF_HEAD, f"refs/heads/{git_default_branch}")
+    cmd_git_garbage_collection          = (*arg_git, *_ARGS_GIT_GARBAGE_COLLECTION)
+    cmd_git_svn_fetch                   = (*arg_git, *_ARGS_GIT_SVN_FETCH)
+    cmd_git_svn_init                    = (*arg_git, *_ARGS_GIT_SVN_INIT, repo_url)
 
 
-     # Add authentication, if provided
+    # Add authentication, if provided
+    # The password is not added to any command's args,
+    # it's fed into the subprocess' stdin by cmd.run_subprocess, to keep it out of process lists and logs
     if username:
-        arg_username                    = ["--username", username]
+        arg_username                    = ("--username", username)
         cmd_git_svn_fetch               += arg_username
         cmd_git_svn_init                += arg_username
 
@@ -190,38 +260,38 @@ def _build_cli_commands(ctx: Context) -> dict:
 
     # There can only be one trunk
     if trunk:
-        cmd_git_svn_init                += ["--trunk", trunk]
+        cmd_git_svn_init                += ("--trunk", trunk)
 
     # Tags and branches can either be single strings or lists of strings
     if tags:
         if isinstance(tags, str):
-            cmd_git_svn_init            += ["--tags", tags]
+            cmd_git_svn_init            += ("--tags", tags)
         if isinstance(tags, list):
             for tag in tags:
-                cmd_git_svn_init        += ["--tags", tag]
+                cmd_git_svn_init        += ("--tags", tag)
 
     if branches:
         if isinstance(branches, str):
-            cmd_git_svn_init            += ["--branches", branches]
+            cmd_git_svn_init            += ("--branches", branches)
         if isinstance(branches, list):
             for branch in branches:
-                cmd_git_svn_init        += ["--branches", branch]
+                cmd_git_svn_init        += ("--branches", branch)
 
     # Default to the standard layout
     if not any([trunk, tags, branches]):
-        cmd_git_svn_init                += ["--stdlayout"]
+        cmd_git_svn_init                += ("--stdlayout",)
 
-    return {
-        'cmd_git_default_branch':           cmd_git_default_branch,
-        'cmd_git_garbage_collection':       cmd_git_garbage_collection,
-        'cmd_git_svn_fetch':                cmd_git_svn_fetch,
-        'cmd_git_svn_init':                 cmd_git_svn_init,
-    }
+    return Commands(
+        git_default_branch          = cmd_git_default_branch,
+        git_garbage_collection      = cmd_git_garbage_collection,
+        git_svn_fetch               = cmd_git_svn_fetch,
+        git_svn_init                = cmd_git_svn_init,
+    )
 
 
 def _check_if_conversion_is_already_running_in_another_process(
         ctx: Context,
-        commands: dict
+        commands: Commands
     ) -> bool:
     """
     Check if any repo conversion-related processes are currently running in the container
@@ -234,70 +304,78 @@ def _check_if_conversion_is_already_running_in_another_process(
     """
 
     # Get config values
-    job_config      = ctx.job.get("config",{})
+    job_config      = ctx.job["config"]
     local_repo_path = job_config.get("local_repo_path")
     max_retries     = job_config.get("max_retries")
     repo_key        = job_config.get("repo_key")
     repo_type       = job_config.get("repo_type")
 
+    # Define the list of strings we're looking for in the running processes' commands
+    # These don't change between retries, so build them once, before the retry loop
+    cmd_git_svn_fetch_string            = " ".join(commands.git_svn_fetch)
+    cmd_git_garbage_collection_string   = " ".join(commands.git_garbage_collection)
+    process_name                        = f"convert_{repo_type}_{repo_key}"
+
+    # In priority order
+    concurrency_error_strings_and_messages = (
+        (cmd_git_svn_fetch_string, "Previous fetching process still"),
+        (cmd_git_garbage_collection_string, "Git garbage collection process still"),
+        (process_name, "Previous process still"),
+        # Potential problem: if one repo's name is a substring of another repo's name
+        (local_repo_path, "Local repo path in process"),
+    )
+
+    # Combine all the strings into one alternation, to find the few processes which match any of them in one regex call each,
+    # so only those are checked against each string in priority order
+    concurrency_error_strings_regex = re.compile(
+        "|".join(re.escape(string) for string, message in concurrency_error_strings_and_messages if string)
+    )
+
     # Range 1 - max_retries + 1 for human readability in logs
     for i in range(1, max_retries + 1):
 
         try:
 
-            # Get running processes, both as a list and string
-            ps_command                          = ["ps", "--no-headers", "-e", "--format", "pid,args"]
-            running_processes_list              = cmd.run_subprocess(ctx, ps_command, quiet=True, name="ps")["output"]
-            running_processes_string            = " ".join(running_processes_list)
-
-            # Define the list of strings we're looking for in the running processes' commands
-            cmd_git_svn_fetch_string            = " ".join(commands["cmd_git_svn_fetch"])
-            cmd_git_garbage_collection_string   = " ".join(commands["cmd_git_garbage_collection"])
-            process_name                        = f"convert_{repo_type}_{repo_key}"
-
-            # In priority order
-            concurrency_error_strings_and_messages = [
-                (cmd_git_svn_fetch_string, "Previous fetching process still"),
-                (cmd_git_garbage_collection_string, "Git garbage collection process still"),
-                (process_name, "Previous process still"),
-                # Potential problem: if one repo's name is a substring of another repo's name
-                (local_repo_path, "Local repo path in process"),
+            # Get running processes, as (pid, args) tuples,
+            # keeping only those which match any of the strings we're looking for
+            running_processes                   = [
+                (pid, args)
+                    for pid, args in cmd.get_running_processes()
+                    if concurrency_error_strings_regex.search(args)
             ]
 
             log_failure_message = ""
 
+            # pids already added to log_failure_message, so each process is only reported for its highest priority match
+            logged_pids         = set()
+
             # Loop through the list of strings we're looking for, to check the running processes for each of them
             for concurrency_error_string_and_message in concurrency_error_strings_and_messages:
 
-                # If this string we're looking for is found
-                if concurrency_error_string_and_message[0] in running_processes_string:
+                # Find which processes it's in, if any
+                # Checking each process' args directly, so the ps output doesn't need to be joined and searched first
+                for pid, args in running_processes:
 
-                    # Find which process it's in
-                    for i in range(len(running_processes_list)):
+                    # If it's this process, and this process hasn't already matched one of the previous concurrency errors
+                    if (
+                        pid not in logged_pids and
+                        concurrency_error_string_and_message[0] and
+                        concurrency_error_string_and_message[0] in args
+                    ):
 
-                        running_process = running_processes_list[i]
-                        pid, args = running_process.lstrip().split(" ", 1)
+                        # Add its message to the string
+                        logged_pids.add(pid)
+                        log_failure_message += f"{concurrency_error_string_and_message[1]} running in pid {pid}; "
 
-                        # If it's this process, and this process hasn't already matched one of the previous concurrency errors
-                        if (
-                            concurrency_error_string_and_message[0] in args and
-                            pid not in log_failure_message
-                        ):
+                        # Calculate its running time
+                        # Quite often, processes will complete when get_pid_uptime() checks them
+                        pid_uptime = cmd.get_pid_uptime(pid)
+                        if pid_uptime:
+                            log_failure_message += f"running for {pid_uptime}; "
+                        else:
+                            log(ctx, f"pid {pid} with command {args} completed while checking for concurrency collisions", "debug")
 
-                            # Add its message to the string
-                            log_failure_message += f"{concurrency_error_string_and_message[1]} running in pid {pid}; "
-
-                            # Calculate its running time
-                            # Quite often, processes will complete when get_pid_uptime() checks them,
-                            # if this is the case, then try this check again
-                            pid_uptime = cmd.get_pid_uptime(int(pid))
-                            if pid_uptime:
-                                log_failure_message += f"running for {pid_uptime}; "
-                            else:
-                                log(ctx, f"pid {pid} with command {args} completed while checking for concurrency collisions, will try checking again", "debug")
-                                i -= 1
-
-                            log_failure_message += f"with command: {args}; "
+                        log_failure_message += f"with command: {args}; "
 
             if log_failure_message:
                 logging.set_job_result(ctx, "skipped", log_failure_message, False)
@@ -319,7 +397,7 @@ def _initialize_pysvn(ctx: Context) -> pysvn.Client:
     Define and register callback handler functions
     """
 
-    job_config                  = ctx.job.get("config",{})
+    job_config                  = ctx.job["config"]
     disable_tls_verification    = job_config.get("disable_tls_verification")
     username                    = job_config.get("username")
     password                    = job_config.get("password")
@@ -396,15 +474,43 @@ def _test_connection_and_credentials(
     """
 
     # Get config values
-    job_config          = ctx.job.get("config", {})
+    job_config          = ctx.job["config"]
+    job_stats_remote    = ctx.job["stats"]["remote"]
+    local_repo_path     = job_config.get("local_repo_path")
     max_retries         = job_config.get("max_retries")
+    min_remote_recheck  = job_config.get("min_remote_recheck_seconds")
     repo_url            = job_config.get("repo_url")
 
+    # If svn info was run for this repo within the last min_remote_recheck_seconds,
+    # and the local repo had already caught up to it, then reuse its results, instead of another round trip to the svn server
+    # If the local repo is behind, we're going to fetch anyway, so get the current revs for the fetch to aim for
+    svn_info_cache_file_path    = os.path.join(local_repo_path, _SVN_INFO_CACHE_FILE) if local_repo_path else ""
+    svn_info_cache              = _read_json_cache_file(svn_info_cache_file_path) if svn_info_cache_file_path else {}
+    if (
+        svn_info_cache.get("repo_url")          == repo_url and
+        svn_info_cache.get("remote_head_rev")                   and
+        svn_info_cache.get("last_changed_rev")                  and
+        svn_info_cache.get("last_changed_date")                 and
+        time.time() - svn_info_cache.get("fetched_at", 0) < min_remote_recheck and
+        _get_cached_git_latest_commit_rev(local_repo_path) == svn_info_cache["last_changed_rev"]
+    ):
+        job_stats_remote["remote_head_rev"]     = svn_info_cache["remote_head_rev"]
+        job_stats_remote["last_changed_rev"]    = svn_info_cache["last_changed_rev"]
+        job_stats_remote["last_changed_date"]   = svn_info_cache["last_changed_date"]
+        log(ctx, f"Skipping the remote connection and credentials check, using cached svn info from {round(time.time() - svn_info_cache['fetched_at'])} seconds ago", "debug")
+        return True
+
     # Variables to track execution and break out of the retry loop
     svn_info            = {}
     svn_info_success    = False
     tries_attempted     = 1
 
+    # Delay between retries, grown with decorrelated jitter
+    retry_delay_seconds = _SVN_INFO_RETRY_DELAY_SECONDS_BASE
+
+    # Total time budget for retries
+    retry_deadline      = time.monotonic() + _SVN_INFO_RETRY_DEADLINE_SECONDS
+
     while True:
 
         try:
@@ -426,17 +532,9 @@ def _test_connection_and_credentials(
                 # Grab the first tuple from the list
                 path, PysvnInfo = svn_info_list_of_tuples[0]
 
-                # Expose the .data attribute from the PysvnInfo type
-                # This is probably overkill, but is the only thing I've found to work so far
-                svn_info_tmp = {
-                    attribute: getattr(PysvnInfo, attribute)
-                        for attribute in dir(PysvnInfo)
-                        if not attribute.startswith('_')
-                        and not callable(getattr(PysvnInfo, attribute))
-                }
-
-                # Use the .data attribute, now that it's available
-                svn_info    = svn_info_tmp.get("data", {})
+                # Read the PysvnInfo type's .data dict directly,
+                # copied into a plain dict, as errors are added to it on retries
+                svn_info    = dict(getattr(PysvnInfo, "data", None) or {})
                 remote_url  = svn_info.get("URL")
 
                 ## Get attributes and convert types
@@ -444,16 +542,17 @@ def _test_connection_and_credentials(
                 remote_head_rev                                     = svn_info.get("rev") # <Revision kind=number 2141>
                 if remote_head_rev:
                     remote_head_rev                                 = int(remote_head_rev.number)
-                    ctx.job["stats"]["remote"]["remote_head_rev"]   = remote_head_rev
+                    job_stats_remote["remote_head_rev"]             = remote_head_rev
 
                 last_changed_rev                                    = svn_info.get("last_changed_rev") # <Revision kind=number 2141>
                 if last_changed_rev:
                     last_changed_rev                                = int(last_changed_rev.number)
-                    ctx.job["stats"]["remote"]["last_changed_rev"]  = last_changed_rev
+                    job_stats_remote["last_changed_rev"]            = last_changed_rev
 
                 last_changed_date                                   = svn_info.get("last_changed_date") # 1753437840.73516
                 if last_changed_date and isinstance(last_changed_date, float):
-                    last_changed_date = datetime.fromtimestamp(last_changed_date).isoformat(sep=' ', timespec='seconds')
+                    last_changed_date                               = datetime.fromtimestamp(last_changed_date).isoformat(sep=' ', timespec='seconds')
+                    job_stats_remote["last_changed_date"]           = last_changed_date
 
 
                 # If all of the attributes came out correctly
@@ -487,6 +586,21 @@ def _test_connection_and_credentials(
         # If the command exited successfully, return here
         if svn_info_success:
 
+            # Cache the results for the next job for this repo
+            # The cache is written into the local repo's .git dir, so it's skipped if the repo doesn't exist yet,
+            # and is deleted along with the repo if it's invalid
+            if svn_info_cache_file_path:
+                _write_json_cache_file(
+                    svn_info_cache_file_path,
+                    {
+                        "fetched_at":           time.time(),
+                        "last_changed_date":    last_changed_date,
+                        "last_changed_rev":     last_changed_rev,
+                        "remote_head_rev":      remote_head_rev,
+                        "repo_url":             repo_url,
+                    }
+                )
+
             if tries_attempted > 1:
                 log(ctx, f"Successfully connected to repo remote after {tries_attempted} tries", "warning")
 
@@ -495,10 +609,10 @@ def _test_connection_and_credentials(
 
             return True
 
-        # If we've hit the max_retries limit, return here
-        elif tries_attempted >= max_retries:
+        # If we've hit the max_retries limit, or run out of time, return here
+        elif tries_attempted >= max_retries or time.monotonic() >= retry_deadline:
 
-            log_failure_message = f"svn info failed to connect to repo remote, reached max retries {max_retries}"
+            log_failure_message = f"svn info failed to connect to repo remote, after {tries_attempted} of max {max_retries} tries, within {_SVN_INFO_RETRY_DEADLINE_SECONDS} seconds"
             logging.set_job_result(ctx, "skipped", log_failure_message, False)
             log(ctx, f"{log_failure_message}", "error", {"svn_info": svn_info})
 
@@ -509,22 +623,97 @@ def _test_connection_and_credentials(
 
             tries_attempted += 1
 
+            # Calculate a capped exponential backoff delay, with decorrelated jitter,
+            # each delay is random between the base and 3x the previous delay,
+            # so a transient blip is retried in a fraction of a second,
+            # a busy svn server gets more breathing room on each retry,
+            # and retries from many concurrent jobs don't all land at the same time
+            retry_delay_seconds = round(min(
+                _SVN_INFO_RETRY_DELAY_SECONDS_MAX,
+                random.uniform(_SVN_INFO_RETRY_DELAY_SECONDS_BASE, retry_delay_seconds * 3)
+            ), 2)
+
+            # Don't sleep past the deadline, the next try is the last one if it's reached
+            retry_delay_seconds = max(0, min(retry_delay_seconds, round(retry_deadline - time.monotonic(), 2)))
+
             # Log the failure
-            retry_delay_seconds = random.randrange(1, 5)
-            log(ctx, f"svn info failed to connect to repo remote, retrying {tries_attempted} of max {max_retries} times, with a semi-random delay of {retry_delay_seconds} seconds", "debug", {"svn_info": svn_info})
+            log(ctx, f"svn info failed to connect to repo remote, retrying {tries_attempted} of max {max_retries} times, with an exponential backoff delay of {retry_delay_seconds} seconds", "debug", {"svn_info": svn_info})
             time.sleep(retry_delay_seconds)
 
         # Repeat the while True loop
 
 
+def _get_cached_git_latest_commit_rev(local_repo_path: str) -> int:
+    """
+    Get the svn rev of the local repo's latest commit, from the local stats cache, without running any git commands
+
+    Returns 0 if the cache is missing, or out of date with the repo's refs
+    """
+
+    refs_fingerprint = _get_git_refs_fingerprint(local_repo_path)
+    if not refs_fingerprint:
+        return 0
+
+    stats_cache = _read_json_cache_file(os.path.join(local_repo_path, _LOCAL_STATS_CACHE_FILE))
+    if stats_cache.get("refs_fingerprint") != refs_fingerprint:
+        return 0
+
+    git_svn_id_revs = _GIT_SVN_ID_REGEX.findall("\n".join(stats_cache.get("latest_commit_metadata") or []))
+
+    return int(git_svn_id_revs[-1]) if git_svn_id_revs else 0
+
+
+def _read_json_cache_file(file_path: str) -> dict:
+    """
+    Read a JSON cache file, returns an empty dict if the file doesn't exist or isn't valid
+    """
+
+    try:
+        with open(file_path, "r") as cache_file:
+            cache = json.load(cache_file)
+
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(cache, dict):
+        return {}
+
+    return cache
+
+
+def _write_json_cache_file(file_path: str, cache: dict) -> None:
+    """
+    Write a JSON cache file, if its parent dir exists
+
+    Writes to a temp file, then renames it over the cache file, so readers never see a partial file
+    Caches are only an optimization, so failures are ignored
+    """
+
+    if not os.path.isdir(os.path.dirname(file_path)):
+        return
+
+    temp_file_path = f"{file_path}.{os.getpid()}.tmp"
+
+    try:
+        with open(temp_file_path, "w") as cache_file:
+            json.dump(cache, cache_file)
+        os.replace(temp_file_path, file_path)
+
+    except OSError:
+        try:
+            os.remove(temp_file_path)
+        except OSError:
+            pass
+
+
 def _check_if_repo_exists_locally(ctx: Context, event: str = "") -> bool:
     """
     Check if the local git repo exists on disk and has the SVN remote URL in its .git/config file
     """
 
     # Get config values
-    job_config          = ctx.job.get("config",{})
-    job_result_action   = ctx.job.get("result",{}).get("action",{})
+    job_config          = ctx.job["config"]
+    job_result_action   = ctx.job["result"].get("action", "")
     remote_url          = job_config.get("repo_url")
     repo_key            = job_config.get("repo_key")
 
@@ -547,7 +736,7 @@ def _check_if_repo_exists_locally(ctx: Context, event: str = "") -> bool:
     has_commits = False
     git_commit_count = 0
     if urls_match:
-        job_stats_local     = _get_local_git_repo_stats(ctx)
+        job_stats_local     = _get_local_git_repo_stats(ctx, include_dir_size=False)
         git_commit_count    = job_stats_local.get("git_commit_count")
         if git_commit_count and isinstance(git_commit_count, int) and git_commit_count > 0:
             has_commits     = True
@@ -578,17 +767,17 @@ def _check_if_repo_exists_locally(ctx: Context, event: str = "") -> bool:
     return False
 
 
-def _initialize_git_repo(ctx: Context, commands: dict) -> None:
+def _initialize_git_repo(ctx: Context, commands: Commands) -> None:
     """
     Initialize a new Git repository
     """
 
     # Get config values
-    job_config          = ctx.job.get("config",{})
+    job_config          = ctx.job["config"]
     bare_clone          = job_config.get("bare_clone")
     local_repo_path     = job_config.get("local_repo_path")
     password            = job_config.get("password")
-    cmd_git_svn_init    = commands["cmd_git_svn_init"]
+    cmd_git_svn_init    = commands.git_svn_init
 
     # If the directory does exist, then it failed the validation check, and needs to be destroyed and recreated
     if os.path.exists(local_repo_path):
@@ -596,9 +785,36 @@ def _initialize_git_repo(ctx: Context, commands: dict) -> None:
 
         # OSError: [Errno 23] Too many open files in system: '079426a942f0583e6906f1f2fd31e703ce366d'
         # shutil.rmtree(local_repo_path)
+        # Use _fast_rmtree() instead, if it needs to be deleted in this process
+
+        # Deleting a large repo can take minutes, so don't block the job on it
+        # Move the directory into the trash dir, which is atomic on the same filesystem,
+        # then delete it in a background process, so it keeps running in parallel with the git svn init, and after this job exits
+        # The trash path doesn't include local_repo_path, so the rm -rf doesn't match the concurrency check for this repo's next jobs
+        repo_trash_dir_path         = lockfiles.get_repo_trash_dir_path(ctx)
+        local_repo_path_to_delete   = os.path.join(repo_trash_dir_path, f"{os.getpid()}.{time.time_ns()}")
+
+        try:
+
+            os.makedirs(repo_trash_dir_path, exist_ok=True)
+            os.rename(local_repo_path, local_repo_path_to_delete)
+            lockfiles.delete_in_background([local_repo_path_to_delete])
 
-        cmd_rm_rf = ["rm", "-rf", local_repo_path]
-        cmd.run_subprocess(ctx, cmd_rm_rf, name=f"cmd_rm_rf", quiet=True)
+            log(ctx, f"Moved {local_repo_path} to {local_repo_path_to_delete}, deleting it in the background", "debug")
+
+        except OSError as e:
+
+            # If the rename fails, fall back to deleting it in place, in this process, and wait for it to finish
+            log(ctx, f"Failed to move {local_repo_path} out of the way, deleting it in place", "warning", exception=e)
+
+            try:
+                _fast_rmtree(local_repo_path)
+
+            except OSError as e:
+
+                # If the in process delete fails part way, ex. EMFILE, finish the job with rm -rf, as the last resort
+                log(ctx, f"Failed to delete {local_repo_path} in process, retrying with rm -rf", "warning", exception=e)
+                cmd.run_subprocess(ctx, ["rm", "-rf", local_repo_path], quiet=True, name="cmd_rm_rf_invalid_repo")
 
     else:
         log(ctx, f"Repo not found on disk, initializing new repo", "info")
@@ -614,13 +830,34 @@ def _initialize_git_repo(ctx: Context, commands: dict) -> None:
         git.set_config(ctx, "core.bare", "true")
 
 
-def _configure_git_repo(ctx: Context, commands: dict) -> None:
+def _fast_rmtree(path: str) -> None:
+    """
+    Delete a directory tree in process, without forking an rm -rf subprocess
+
+    Reads each directory's entries, and closes its fd, before descending into its subdirectories,
+    so only one directory fd is open at a time, unlike shutil.rmtree,
+    which ran out of file descriptors on large repos
+    """
+
+    with os.scandir(path) as dir_entries:
+        entries = [(dir_entry.path, dir_entry.is_dir(follow_symlinks=False)) for dir_entry in dir_entries]
+
+    for entry_path, is_dir in entries:
+        if is_dir:
+            _fast_rmtree(entry_path)
+        else:
+            os.unlink(entry_path)
+
+    os.rmdir(path)
+
+
+def _configure_git_repo(ctx: Context, commands: Commands) -> None:
     """
     Configure Git repository settings
     """
 
     # Get config values
-    job_config              = ctx.job.get("config",{})
+    job_config              = ctx.job["config"]
     authors_file_path       = job_config.get("authors_file_path")
     authors_prog_path       = job_config.get("authors_prog_path")
     git_ignore_file_path    = job_config.get("git_ignore_file_path")
@@ -629,7 +866,7 @@ def _configure_git_repo(ctx: Context, commands: dict) -> None:
 
     # Set the default branch local to this repo, after init
     # TODO: Move to git module
-    cmd.run_subprocess(ctx, commands["cmd_git_default_branch"], quiet=True, name="cmd_git_default_branch")
+    cmd.run_subprocess(ctx, commands.git_default_branch, quiet=True, name="cmd_git_default_branch")
 
 
     # Set repo configs, as a list of tuples [(git config key, git config value),]
@@ -638,13 +875,18 @@ def _configure_git_repo(ctx: Context, commands: dict) -> None:
         ("svn.authorsProg", authors_prog_path),
     ]
 
+    # Read all of the repo's current configs in one git command, instead of one per key
+    current_git_config = {}
+    if any(git_config_value for git_config_key, git_config_value in git_config_paths):
+        current_git_config = git.get_all_config(ctx)
+
     for git_config_key, git_config_value in git_config_paths:
 
         if git_config_value:
 
             # Check if these configs are already set the same before trying to set them
             # TODO: Test this
-            config_already_set          = " ".join(git.get_config(ctx, git_config_key))
+            config_already_set          = current_git_config.get(git_config_key.lower(), "")
             config_already_set_matches  = config_already_set == git_config_value
             path_exists                 = os.path.exists(git_config_value)
 
@@ -673,17 +915,23 @@ def _configure_git_repo(ctx: Context, commands: dict) -> None:
             log(ctx, f".gitignore file not found at {git_ignore_file_path}, skipping copying it", "warning")
 
 
-def _get_local_git_repo_stats(ctx: Context, event: str = "") -> dict:
+# Matches the rev number in the git-svn-id trailer of a commit message converted by git svn
+_GIT_SVN_ID_REGEX = re.compile(r"git-svn-id:\s*\S+@(\d+)")
+
+
+def _get_local_git_repo_stats(ctx: Context, event: str = "", include_dir_size: bool = True) -> dict:
     """
     Functions to collect statistics for local repo
 
     This function gets called as part of checking if the repo exists on disk,
     so it needs sufficient bubble wrap to handle errors
+
+    include_dir_size=False skips walking the repo dir for its size, the most expensive stat on large repos
     """
 
     # Get config values
-    job_config      = ctx.job.get("config",{})
-    job_stats_local = ctx.job.get("stats",{}).get("local",{})
+    job_config      = ctx.job["config"]
+    job_stats_local = ctx.job["stats"]["local"]
 
     # Define return dict
     return_dict     = {}
@@ -692,57 +940,76 @@ def _get_local_git_repo_stats(ctx: Context, event: str = "") -> dict:
     if event:
         event = f"_{event}"
 
-    ## dir size
-    # TODO: Move to git module
     local_repo_path = job_config.get("local_repo_path")
-    git_dir_size      = 0
 
-    # Python approach
-    # path            = Path(local_repo_path)
-    # for file in path.glob('**/*'): # '**/*' matches all files and directories recursively
-    #     if file.is_file():
-    #         git_dir_size += file.stat().st_size
+    ## Reuse the git probes' results from a previous run, if none of the repo's refs or git svn metadata have changed since
+    # The fingerprint is taken before running the probes,
+    # so if the repo changes while they're running, the next run's fingerprint won't match the cache
+    refs_fingerprint        = _get_git_refs_fingerprint(local_repo_path)
+    stats_cache_file_path   = os.path.join(local_repo_path, _LOCAL_STATS_CACHE_FILE) if refs_fingerprint else ""
+    stats_cache             = _read_json_cache_file(stats_cache_file_path) if stats_cache_file_path else {}
+    stats_cache_hit         = bool(refs_fingerprint) and stats_cache.get("refs_fingerprint") == refs_fingerprint
+
+    ## Run the read only probes concurrently
+    # Each one is its own subprocess, with no dependencies between them,
+    # so run them in threads, to overlap their process startup and disk I/O, instead of waiting for each in turn
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        if include_dir_size:
+            future_git_dir_size             = executor.submit(_get_git_dir_size, ctx, local_repo_path)
+        if not stats_cache_hit:
+            future_git_commit_count         = executor.submit(git.get_count_of_commits_in_repo, ctx)
+            future_latest_commit_metadata   = executor.submit(git.get_latest_commit_metadata, ctx)
+            future_try_branches_max_rev     = executor.submit(git.get_config, ctx, key="svn-remote.svn.branches-maxRev", config_file_path=".git/svn/.metadata", quiet=True)
+
+    if stats_cache_hit:
+        git_commit_count        = stats_cache.get("git_commit_count")
+        latest_commit_metadata  = stats_cache.get("latest_commit_metadata") or []
+        try_branches_max_rev    = stats_cache.get("try_branches_max_rev") or []
 
-    # du approach
-    cmd_du_repo_size                = ["du", "-s", local_repo_path]
-    cmd_du_repo_size_result         = cmd.run_subprocess(ctx, cmd_du_repo_size, quiet=True, name="cmd_du_repo_size", stderr="ignore")
-    cmd_du_repo_size_return_code    = cmd_du_repo_size_result.get("return_code")
-    cmd_du_repo_size_output         = cmd_du_repo_size_result.get("output")
-    len_cmd_du_repo_size_output     = len(cmd_du_repo_size_output)
-
-    if (
-        cmd_du_repo_size_return_code    == 0 and
-        len_cmd_du_repo_size_output     > 0
-    ):
+    else:
+        git_commit_count        = future_git_commit_count.result()
+        latest_commit_metadata  = future_latest_commit_metadata.result() or []
+        try_branches_max_rev    = future_try_branches_max_rev.result() or []
+
+        # Only cache results from a valid repo
+        if refs_fingerprint and git_commit_count is not None:
+            _write_json_cache_file(
+                stats_cache_file_path,
+                {
+                    "git_commit_count":         git_commit_count,
+                    "latest_commit_metadata":   latest_commit_metadata,
+                    "refs_fingerprint":         refs_fingerprint,
+                    "try_branches_max_rev":     try_branches_max_rev,
+                }
+            )
 
-        git_dir_size = " ".join(cmd_du_repo_size_result.get("output", []))
-        git_dir_size = int(git_dir_size.split()[0])
+    ## dir size
+    git_dir_size = future_git_dir_size.result() if include_dir_size else 0
 
-        if git_dir_size:
+    if git_dir_size:
 
-            return_dict.update({f"git_dir_size{event}": git_dir_size})
+        return_dict.update({f"git_dir_size{event}": git_dir_size})
 
-            if event == "end":
+        if event == "_end":
 
-                # Not defaulting to 0, as that'd only hide a coding problem we'd need to fix
-                git_dir_size_begin = job_stats_local.get("git_dir_size_begin")
+            # The beginning size isn't collected on jobs which skipped the fetch, as the repo was already up to date
+            git_dir_size_begin = job_stats_local.get("git_dir_size_begin")
+            if git_dir_size_begin:
                 return_dict.update({"git_dir_size_added": (git_dir_size - git_dir_size_begin)})
 
     ## Commit count
-    git_commit_count = git.get_count_of_commits_in_repo(ctx)
     return_dict.update({f"git_commit_count{event}": git_commit_count})
 
     ## Latest commit metadata
-    latest_commit_metadata = list(git.get_latest_commit_metadata(ctx))
-
     # If we got all the results back we need
     if len(latest_commit_metadata) >= 4:
 
         # Try to extract the last converted subversion rev from the commit message body
+        # ex. git-svn-id: https://svn.apache.org/repos/asf/ambari@1234567 13f79535-47bb-0310-9956-ffa450edef68
         last_converted_subversion_rev = 0
-        for line in reversed(latest_commit_metadata):
-            if "git-svn-id" in line:
-                last_converted_subversion_rev = int(line.split('@')[1].split()[0])
+        git_svn_id_revs = _GIT_SVN_ID_REGEX.findall("\n".join(latest_commit_metadata))
+        if git_svn_id_revs:
+            last_converted_subversion_rev = int(git_svn_id_revs[-1])
 
         return_dict.update(
             {
@@ -754,8 +1021,6 @@ def _get_local_git_repo_stats(ctx: Context, event: str = "") -> dict:
         )
 
     ## Get metadata from previous runs of git svn
-    try_branches_max_rev = git.get_config(ctx, key="svn-remote.svn.branches-maxRev", config_file_path=".git/svn/.metadata", quiet=True)
-
     if try_branches_max_rev:
 
         try:
@@ -766,11 +1031,109 @@ def _get_local_git_repo_stats(ctx: Context, event: str = "") -> dict:
             pass
 
     if event:
-        ctx.job["stats"]["local"].update(return_dict)
+        job_stats_local.update(return_dict)
 
     return return_dict
 
 
+def _get_git_refs_fingerprint(local_repo_path: str) -> str:
+    """
+    Get a fingerprint of the local repo's refs and git svn metadata,
+    from the mtimes and sizes of the files git and git svn update when they add commits or fetch revs,
+    without running any git commands
+
+    Returns an empty string if the repo doesn't exist
+    """
+
+    if not local_repo_path:
+        return ""
+
+    git_dir_path = os.path.join(local_repo_path, ".git")
+
+    # If HEAD doesn't exist, then it's not a repo
+    if not os.path.isfile(os.path.join(git_dir_path, "HEAD")):
+        return ""
+
+    file_paths = [
+        os.path.join(git_dir_path, "HEAD"),
+        os.path.join(git_dir_path, "packed-refs"),
+        os.path.join(git_dir_path, "svn", ".metadata"),
+    ]
+
+    # Loose refs, ex. refs/remotes/origin/trunk
+    dirs_to_scan = [os.path.join(git_dir_path, "refs")]
+    while dirs_to_scan:
+        try:
+            with os.scandir(dirs_to_scan.pop()) as dir_entries:
+                for dir_entry in dir_entries:
+                    if dir_entry.is_dir(follow_symlinks=False):
+                        dirs_to_scan.append(dir_entry.path)
+                    else:
+                        file_paths.append(dir_entry.path)
+        except OSError:
+            pass
+
+    fingerprint = []
+    for file_path in sorted(file_paths):
+        try:
+            file_stat = os.stat(file_path)
+            fingerprint.append(f"{os.path.relpath(file_path, git_dir_path)}:{file_stat.st_mtime_ns}:{file_stat.st_size}")
+        except OSError:
+            pass
+
+    return "|".join(fingerprint)
+
+
+def _get_git_dir_size(ctx: Context, local_repo_path: str) -> int:
+    """
+    Get the size of the local repo on disk, in the same 1 KiB block units as du -s
+
+    Walks the tree in process with os.scandir, instead of forking a du subprocess
+    Reuses the result of a walk in the last _GIT_DIR_SIZE_CACHE_TTL_SECONDS
+    """
+
+    # Reuse a recent walk, if it hasn't been invalidated by a fetch since
+    cached = _git_dir_size_cache.get(local_repo_path)
+    if cached and time.monotonic() - cached[0] < _GIT_DIR_SIZE_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    # TODO: Move to git module
+    git_dir_size_bytes  = 0
+    dirs_to_scan        = []
+
+    # Count the top level dir itself too, like du does
+    try:
+        git_dir_size_bytes  += os.lstat(local_repo_path).st_blocks * 512
+        dirs_to_scan        = [local_repo_path]
+    except (OSError, TypeError):
+        pass
+
+    while dirs_to_scan:
+
+        try:
+            with os.scandir(dirs_to_scan.pop()) as dir_entries:
+                for dir_entry in dir_entries:
+
+                    # The repo is changing underneath us during a fetch, so files can disappear mid walk
+                    try:
+                        # Count allocated blocks, not st_size, to match du
+                        git_dir_size_bytes += dir_entry.stat(follow_symlinks=False).st_blocks * 512
+
+                        if dir_entry.is_dir(follow_symlinks=False):
+                            dirs_to_scan.append(dir_entry.path)
+
+                    except OSError:
+                        pass
+
+        except OSError:
+            pass
+
+    git_dir_size = git_dir_size_bytes // 1024
+    _git_dir_size_cache[local_repo_path] = (time.monotonic(), git_dir_size)
+
+    return git_dir_size
+
+
 def _check_if_repo_up_to_date(ctx: Context) -> bool:
     """
     Get the git_latest_commit_rev_begin from the local git repo
@@ -778,9 +1141,9 @@ def _check_if_repo_up_to_date(ctx: Context) -> bool:
     Compare it against remote_current_rev from the svn info output
     """
 
-    job_stats                   = ctx.job.get("stats",{})
-    git_latest_commit_rev_begin = job_stats.get("local", {}).get("git_latest_commit_rev_begin")
-    last_changed_rev            = job_stats.get("remote",{}).get("last_changed_rev")
+    job_stats                   = ctx.job["stats"]
+    git_latest_commit_rev_begin = job_stats["local"].get("git_latest_commit_rev_begin")
+    last_changed_rev            = job_stats["remote"].get("last_changed_rev")
 
     if (
         git_latest_commit_rev_begin and
@@ -791,17 +1154,31 @@ def _check_if_repo_up_to_date(ctx: Context) -> bool:
         return True
 
     else:
+
+        # Record how far behind the local repo is, from the revs we already have,
+        # instead of asking the svn server to list the remaining revs
+        # This is the span of rev numbers, an upper bound on the number of commits to fetch,
+        # as not every rev in the svn server touches this repo's paths
+        if (
+            git_latest_commit_rev_begin and
+            last_changed_rev            and
+            last_changed_rev > git_latest_commit_rev_begin
+        ):
+            job_stats["remote"]["revs_out_of_date"] = last_changed_rev - git_latest_commit_rev_begin
+
         logging.set_job_result(ctx, "fetching", "repo out of date")
         return False
 
 
-def _cleanup(ctx: Context) -> None:
+def _cleanup(ctx: Context, include_dir_size: bool = True) -> None:
     """
     Groups up any other functions needed to clean up before exit
+
+    include_dir_size=False skips walking the repo dir for its size, for jobs which didn't fetch
     """
 
     # Get dir size of converted git repo
-    _get_local_git_repo_stats(ctx, "end")
+    _get_local_git_repo_stats(ctx, "end", include_dir_size=include_dir_size)
 
     # Run git garbage collection and cleanup branches, even if repo is already up to date
     # Order is important, garbage_collection must run before cleanup_branches_and_tags
@@ -809,27 +1186,37 @@ def _cleanup(ctx: Context) -> None:
     git.cleanup_branches_and_tags(ctx)
 
 
-def _git_svn_fetch(ctx: Context, commands: dict) -> bool:
+def _git_svn_fetch(ctx: Context, commands: Commands) -> bool:
     """
     Execute the git svn fetch operation
     """
 
     log(ctx, f"Repo out of date, fetching", "info")
 
+    # Get the job's config dict once, its values are updated between tries
+    job_config              = ctx.job["config"]
+    job_result              = ctx.job["result"]
+    job_stats_local         = ctx.job["stats"]["local"]
+
     # Do while loop for retries
     tries_attempted = 1
 
+    # Count of consecutive failed tries which didn't add any commits, reset when a try makes progress
+    consecutive_tries_without_progress = 0
+
+    # Build the fetch command once, as a list copy of the commands.git_svn_fetch tuple
+    # Only the log window size value, in the last element, changes between tries
+    cmd_git_svn_fetch       = [*commands.git_svn_fetch, "--log-window-size", ""]
+
     while True:
 
         # Get config values
-        cmd_git_svn_fetch   = commands["cmd_git_svn_fetch"]
-        job_config          = ctx.job.get("config", {})
-        log_window_size     = job_config.get("log_window_size", 100)
-        max_retries         = job_config.get("max_retries")
+        log_window_size     = int(job_config.get("log_window_size") or _REPO_CONFIG_DEFAULTS["log_window_size"])
+        max_retries         = int(job_config.get("max_retries") or _REPO_CONFIG_DEFAULTS["max_retries"])
         password            = job_config.get("password")
 
         # Reset result values
-        ctx.job["result"].update({
+        job_result.update({
             "action":   "git svn fetch",
             "try":      tries_attempted,
 
@@ -844,7 +1231,7 @@ def _git_svn_fetch(ctx: Context, commands: dict) -> bool:
         ]
         for key in pop_keys:
             try:
-                ctx.job["result"].pop(key)
+                job_result.pop(key)
             except KeyError:
                 pass
 
@@ -852,13 +1239,21 @@ def _git_svn_fetch(ctx: Context, commands: dict) -> bool:
         git.deduplicate_git_config_file(ctx)
 
         # Try setting the log window size to see if it helps with network timeout stability
-        cmd_git_svn_fetch += ["--log-window-size", str(log_window_size)]
+        cmd_git_svn_fetch[-1] = str(log_window_size)
+
+        # Bound the fetch to the range of revs which haven't been fetched yet,
+        # recalculated on each try, as a failed try may have still fetched some revs
+        cmd_git_svn_fetch_this_try = cmd_git_svn_fetch
+        revision_range = _get_git_svn_fetch_revision_range(ctx)
+        if revision_range:
+            cmd_git_svn_fetch_this_try = cmd_git_svn_fetch + ["--revision", revision_range]
 
         # Start the fetch
-        log(ctx, f"Fetching with {' '.join(cmd_git_svn_fetch)}", "debug")
+        log(ctx, f"Fetching with {' '.join(cmd_git_svn_fetch_this_try)}", "debug")
 
         # Run the fetch command, capture the output
-        git_svn_fetch_result = cmd.run_subprocess(ctx, cmd_git_svn_fetch, password, name=f"cmd_git_svn_fetch_{tries_attempted}")
+        # Filter out the non-error lines as the output is read, so the full output is never held in memory
+        git_svn_fetch_result = cmd.run_subprocess(ctx, cmd_git_svn_fetch_this_try, password, name=f"cmd_git_svn_fetch_{tries_attempted}", output_filter=_is_git_svn_fetch_output_line_kept)
         git_svn_fetch_result.update({"tries_attempted": tries_attempted})
 
         # Run gc + fix branches, after each try, to:
@@ -868,41 +1263,103 @@ def _git_svn_fetch(ctx: Context, commands: dict) -> bool:
         git.garbage_collection(ctx)
         git.cleanup_branches_and_tags(ctx)
 
+        # The fetch and gc changed the repo, so the success check needs a fresh dir size
+        _git_dir_size_cache.pop(job_config.get("local_repo_path"), None)
+
         # If successful, break the while true loop here
         if _check_git_svn_fetch_success(ctx, git_svn_fetch_result):
             return True
 
+        # Circuit breaker: if the fetches aren't making progress, more retries are unlikely to help,
+        # so break the while true loop with an error here, instead of using up all of max_retries
+        # Checked before max_retries, so it can stop the job before the last try
+        # Only count a try as progress if it added commits, not if the count went down
+        if int(job_stats_local.get(f"git_commit_count_added_try_{tries_attempted}") or 0) > 0:
+            consecutive_tries_without_progress = 0
+
+        else:
+            consecutive_tries_without_progress += 1
+
+            if consecutive_tries_without_progress >= _MAX_TRIES_WITHOUT_PROGRESS:
+                log(ctx, f"Giving up after {consecutive_tries_without_progress} consecutive tries without adding any commits", "error")
+                return False
+
         # If we've hit the max_retries limit, break the while true loop with an error here
-        elif tries_attempted >= max_retries:
+        if tries_attempted >= max_retries:
             return False
 
         # Otherwise, prepare for retry
-        else:
+        tries_attempted += 1
 
-            tries_attempted += 1
+        # Divide the log window size in half for the next try, down to the minimum
+        job_config.update({"log_window_size": max(_LOG_WINDOW_SIZE_MIN, log_window_size // 2)})
 
-            # Divide the log window size in half for the next try
-            ctx.job["config"].update({"log_window_size": int(log_window_size) // 2})
+        # Try clearing lock files,
+        # in case that was the cause of the failure,
+        # or lock files may have been left behind by the failed try
+        lockfiles.clear_lock_files(ctx)
 
-            # Try clearing lock files,
-            # in case that was the cause of the failure,
-            # or lock files may have been left behind by the failed try
-            lockfiles.clear_lock_files(ctx)
+        # Calculate a capped backoff, with jitter,
+        # the longer of exponential in the number of tries, or scaled from how long the failed try ran,
+        # so retries back off further if the server is slow or busy,
+        # and retries from many repos on the same server don't all land at once
+        fetch_duration_seconds  = git_svn_fetch_result.get("execution_time_seconds") or 0
+        retry_delay_seconds     = max(2 ** (tries_attempted - 1), _RETRY_DELAY_FETCH_DURATION_FACTOR * fetch_duration_seconds)
+        retry_delay_seconds     = round(min(_RETRY_DELAY_SECONDS_MAX, retry_delay_seconds) + random.random(), 2)
 
-            # Calculate a semi-random number of seconds to wait before trying
-            # Multiply by number of retries attempted, for a bit of a backoff,
-            # in case the server is busy
-            retry_delay_seconds = (random.randrange(1, 5) * tries_attempted)
-
-            # Log the failure
-            log(ctx, f"retrying {tries_attempted} of max {max_retries} times, with a semi-random delay of {retry_delay_seconds} seconds", "debug")
+        # Log the failure
+        log(ctx, f"retrying {tries_attempted} of max {max_retries} times, after a {fetch_duration_seconds:.1f} second failed try, with a backoff delay of {retry_delay_seconds} seconds", "debug")
 
-            # Sleep the delay
-            time.sleep(retry_delay_seconds)
+        # Sleep the delay
+        time.sleep(retry_delay_seconds)
 
         # Repeat the retry loop
 
 
+def _get_git_svn_fetch_revision_range(ctx: Context) -> str:
+    """
+    Get the range of svn revs for git svn fetch's --revision arg, as "first:last"
+
+    first is the rev after the highest rev git svn has already fetched, for both branches and tags,
+    last is svn info's last changed rev for the repo's path,
+    so git svn doesn't walk the revs after it, which can't have changed anything in this repo
+
+    Returns an empty string if the range can't be determined, ex. git svn hasn't fetched anything yet,
+    or branches-maxRev and tags-maxRev differ, to let git svn fetch use its defaults
+    """
+
+    job_stats                   = ctx.job["stats"]
+    last_changed_rev            = int(job_stats["remote"].get("last_changed_rev") or 0)
+    git_latest_commit_rev_begin = int(job_stats["local"].get("git_latest_commit_rev_begin") or 0)
+
+    if not last_changed_rev:
+        return ""
+
+    # Read the current branches-maxRev and tags-maxRev, rather than the values from the beginning of the job,
+    # as previous tries in this job may have moved them forward
+    # Starting below either of them would make git svn fail with "Last fetched revision of ... but we are about to fetch",
+    # and starting above either of them would skip the revs in between for those refs,
+    # so only bound the range if git svn has fetched both up to the same rev
+    git_svn_metadata = git.get_all_config(ctx, config_file_path=".git/svn/.metadata", quiet=True)
+
+    try:
+        branches_max_rev    = int(git_svn_metadata["svn-remote.svn.branches-maxrev"])
+        tags_max_rev        = int(git_svn_metadata["svn-remote.svn.tags-maxrev"])
+    except (KeyError, ValueError):
+        return ""
+
+    if branches_max_rev != tags_max_rev:
+        log(ctx, f"Not bounding git svn fetch revision range, as branches-maxRev {branches_max_rev} != tags-maxRev {tags_max_rev}", "debug")
+        return ""
+
+    first_rev = max(git_latest_commit_rev_begin, branches_max_rev) + 1
+
+    if first_rev > last_changed_rev:
+        return ""
+
+    return f"{first_rev}:{last_changed_rev}"
+
+
 def _check_git_svn_fetch_success(ctx: Context, git_svn_fetch_result: dict) -> bool:
     """
     Check the local repo clone to verify the git svn fetch command completed successfully
@@ -930,8 +1387,9 @@ def _check_git_svn_fetch_success(ctx: Context, git_svn_fetch_result: dict) -> bo
     """
 
     ## Gather needed inputs
-    job_config              = ctx.job.get("config",{})
-    max_retries             = job_config.get("max_retries")
+    job_config              = ctx.job["config"]
+    job_result              = ctx.job["result"]
+    max_retries             = int(job_config.get("max_retries") or _REPO_CONFIG_DEFAULTS["max_retries"])
     git_svn_fetch_output    = git_svn_fetch_result.pop("output",[])
     return_code             = git_svn_fetch_result.get("return_code")
     tries_attempted         = git_svn_fetch_result.get("tries_attempted")
@@ -953,53 +1411,35 @@ def _check_git_svn_fetch_success(ctx: Context, git_svn_fetch_result: dict) -> bo
         errors.append("Repo validity check _check_if_repo_exists_locally failed")
 
 
-    # Filter out the non-error lines from the process output
-    git_svn_fetch_output                    = _remove_non_errors_from_git_svn_fetch_output(ctx, git_svn_fetch_output)
-
-    # Search the remaining lines of the process output for known errors
-    errors_from_output                      = _find_errors_in_svn_output(ctx, git_svn_fetch_output)
-    if errors_from_output:
-        errors += errors_from_output
-
-
     ## Commit count checks
     current_job_stats_local_git_repo_stats  = _get_local_git_repo_stats(ctx)
-    job_stats_local                         = ctx.job.get("stats",{}).get("local",{})
+    job_stats                               = ctx.job["stats"]
+    job_stats_local                         = job_stats["local"]
+
+    # Read each count once, as an int, defaulting missing / None values to 0,
+    # so the math below doesn't need any more type checks or conversions
 
     # Get the number of commits which were already in the local git repo before the job started
-    git_commit_count_begin                  = job_stats_local.get("git_commit_count_begin", 0)
-    if not git_commit_count_begin:
-        git_commit_count_begin = 0
+    git_commit_count_begin                  = int(job_stats_local.get("git_commit_count_begin") or 0)
 
     # Get the current number of commits in the local git repo after this fetch attempt (includes all retries)
-    current_git_commit_count                = current_job_stats_local_git_repo_stats.get("git_commit_count", 0)
-    if not current_git_commit_count:
-        current_git_commit_count = 0
-
+    current_git_commit_count                = int(current_job_stats_local_git_repo_stats.get("git_commit_count") or 0)
 
 
     ## This try commit counts
     # Order is important, must be before ## Whole job commit counts,
     # because this tries to use the git_commit_count_added_whole_job from the previous retry
     # Get the count of commits from the end of the previous try
-    git_commit_count_added_whole_job        = job_stats_local.get("git_commit_count_added_whole_job", 0)
-    git_commit_count_after_previous_try     = 0
-
-    if git_commit_count_added_whole_job and isinstance(git_commit_count_added_whole_job, int):
-        git_commit_count_after_previous_try += git_commit_count_added_whole_job
-
-    if git_commit_count_begin and isinstance(git_commit_count_begin, int):
-        git_commit_count_after_previous_try += git_commit_count_begin
-
+    git_commit_count_after_previous_try     = int(job_stats_local.get("git_commit_count_added_whole_job") or 0) + git_commit_count_begin
 
     # Calculate the number of commits added since the previous try
     git_commit_count_added_this_try         = 0
 
-    if current_git_commit_count and isinstance(current_git_commit_count, int):
+    if current_git_commit_count:
         git_commit_count_added_this_try     = current_git_commit_count - git_commit_count_after_previous_try
 
     # Store the number of commits from this try
-    ctx.job["stats"]["local"].update({f"git_commit_count_added_try_{tries_attempted}": git_commit_count_added_this_try})
+    job_stats_local.update({f"git_commit_count_added_try_{tries_attempted}": git_commit_count_added_this_try})
     # If no commits were added on this try, add this to the list of errors
     if git_commit_count_added_this_try      == 0:
         errors.append(f"git_commit_count_added_this_try == 0, the fetch in this try failed to add any new commits")
@@ -1008,36 +1448,56 @@ def _check_git_svn_fetch_success(ctx: Context, git_svn_fetch_result: dict) -> bo
     ## Whole job commit counts
     # Order is important, must be after ## This try commit counts
     # Calculate the number of commits added since the beginning of the job (includes all retries)
-    git_commit_count_added_whole_job        = 0
-    git_commit_count_added_whole_job        = int(current_git_commit_count) - int(git_commit_count_begin)
+    git_commit_count_added_whole_job        = current_git_commit_count - git_commit_count_begin
     # Update the number of commits added since the beginning of the job (includes all retries)
-    ctx.job["stats"]["local"].update({"git_commit_count_added_whole_job": git_commit_count_added_whole_job})
+    job_stats_local.update({"git_commit_count_added_whole_job": git_commit_count_added_whole_job})
     # If no commits have been added the whole job, add this to the list of errors
     if git_commit_count_added_whole_job     == 0:
         errors.append(f"git_commit_count_added_whole_job == 0, all fetches in this job so far have failed to add any new commits")
 
 
+    ## Process output checks
+    # Order is important, must be after ## This try commit counts
+    # If the fetch exited cleanly and added commits, the output can't change the outcome,
+    # so skip scanning it, which is the most expensive part of this check on long outputs
+    # The non-error lines were already filtered out of the output by run_subprocess, as it was read
+    if return_code != 0 or git_commit_count_added_this_try <= 0:
+
+        # Search the remaining lines of the process output for known errors
+        errors_from_output                  = _find_errors_in_svn_output(ctx, git_svn_fetch_output)
+        if errors_from_output:
+            errors += errors_from_output
+
+    elif git_svn_fetch_output:
+
+        # Still store a truncated copy of the remaining output for the job's result log, as _find_errors_in_svn_output would
+        job_result["remaining_output"]      = cmd.truncate_output(ctx, git_svn_fetch_output)
+
+
     ## Add git_dir_size
     # Same logic as commit counts
 
     # Get the number of commits which were already in the local git repo before the job started
-    current_git_dir_size                = current_job_stats_local_git_repo_stats.get("git_dir_size",0)
-    git_dir_size_begin                  = int(job_stats_local.get("git_dir_size_begin",0))
-    git_dir_size_after_previous_try     = int(job_stats_local.get("git_dir_size_added_whole_job", 0)) + int(git_dir_size_begin)
+    current_git_dir_size                = int(current_job_stats_local_git_repo_stats.get("git_dir_size") or 0)
+    git_dir_size_begin                  = int(job_stats_local.get("git_dir_size_begin") or 0)
+    git_dir_size_after_previous_try     = int(job_stats_local.get("git_dir_size_added_whole_job") or 0) + git_dir_size_begin
 
-    git_dir_size_added_this_try         = int(current_git_dir_size) - int(git_dir_size_after_previous_try)
-    ctx.job["stats"]["local"].update({f"git_dir_size_added_try_{tries_attempted}": git_dir_size_added_this_try})
+    git_dir_size_added_this_try         = current_git_dir_size - git_dir_size_after_previous_try
+    job_stats_local.update({f"git_dir_size_added_try_{tries_attempted}": git_dir_size_added_this_try})
 
-    git_dir_size_added_whole_job        = int(current_git_dir_size) - int(git_dir_size_begin)
-    ctx.job["stats"]["local"].update({"git_dir_size_added_whole_job": git_dir_size_added_whole_job})
+    git_dir_size_added_whole_job        = current_git_dir_size - git_dir_size_begin
+    job_stats_local.update({"git_dir_size_added_whole_job": git_dir_size_added_whole_job})
 
 
     # Check if git svn has blown past svn info's "Last Changed Rev"
-    branches_max_rev        = current_job_stats_local_git_repo_stats.get("svn_metadata_branches_max_rev", 0)
-    last_changed_rev        = ctx.job.get("stats",{}).get("remote",{}).get("last_changed_rev")
-    git_latest_commit_rev   = current_job_stats_local_git_repo_stats.get("git_latest_commit_rev", 0)
+    # Default any missing values to 0, so the comparisons below can't raise a TypeError on None,
+    # and skip the checks if last_changed_rev is unknown, as every branches_max_rev would be > 0
+    branches_max_rev        = int(current_job_stats_local_git_repo_stats.get("svn_metadata_branches_max_rev") or 0)
+    last_changed_rev        = int(job_stats["remote"].get("last_changed_rev") or 0)
+    git_latest_commit_rev   = int(current_job_stats_local_git_repo_stats.get("git_latest_commit_rev") or 0)
 
     if (
+        last_changed_rev and
         branches_max_rev > last_changed_rev and
         current_git_commit_count == 0
     ):
@@ -1056,6 +1516,7 @@ def _check_git_svn_fetch_success(ctx: Context, git_svn_fetch_result: dict) -> bo
     # this repo will always be out of date, unless we can back up branches_max_rev to let us sync
     # the last changed rev
     if (
+        last_changed_rev and
         branches_max_rev    > last_changed_rev and
         last_changed_rev    > git_latest_commit_rev
     ):
@@ -1070,9 +1531,9 @@ def _check_git_svn_fetch_success(ctx: Context, git_svn_fetch_result: dict) -> bo
 
     # Assign the lists to the job result data for log output
     if errors:
-        ctx.job["result"]["errors"]     = errors
+        job_result["errors"]            = errors
     if warnings:
-        ctx.job["result"]["warnings"]   = warnings
+        job_result["warnings"]          = warnings
     action                              = "git svn fetch"
     reason                              = ""
     structured_log_dict                 = {"process": git_svn_fetch_result}
@@ -1102,70 +1563,171 @@ def _check_git_svn_fetch_success(ctx: Context, git_svn_fetch_result: dict) -> bo
     return success
 
 
-def _remove_non_errors_from_git_svn_fetch_output(ctx: Context, git_svn_fetch_output: list = []) -> list:
-    """
-    Filter out lines from the git svn fetch output which are known to not be problems
-    Keep this list tidy, as execution time is len(error_messages) x len(git_svn_fetch_result_output)
+# Shorten the number of lines in the git svn output,
+# by removing lines which we know are not errors / may be false positives
+# Sort in order from most lines in typical output to least, to remove the most lines earliest
+_IGNORE_LINES_PATTERNS = [
+    r"\tA\t.*",                         # "\tA\tdir/file.ext",          # Add a new file
+    r"\tM\t.*",                         # "\tM\tdir/file.ext",          # Modify a file
+    r"r[0-9]+ = .*",                    # r[rev] = [hash] (refs/remotes/origin/tags/[tag])
+    r"Checked through r[0-9]+",         # "Checked through r123456"     # Many of the lines
+    r"\tD\t.*",                         # "\tD\tdir/file.ext",          # Delete a file
+    r"W: \+empty_dir: .*",
+    r"W: -empty_dir: .*",
+    r"Index mismatch: \w+ != \w+",
+    r"rereading \w+",
+    r"W: Ignoring error from SVN.*",    # "W: Ignoring error from SVN, path probably does not exist: (160013): Filesystem has no item: File not found..."
+    r"Auto packing the repository in background for optimum performance.",
+    r"See \"git help gc\" for manual housekeeping.",
+    r"Authentication realm: .*",
+    r"Password for '.*':",
+    r"This may take a while on large repositories",
+    r"W: Do not be alarmed at the above message git-svn is just searching aggressively for old history.",
+    r"branch_from: .*",
+    r"Found possible branch point: .*",
+    r"Initializing parent: .*",
+    r"Found branch parent: .*",
+    r"Following parent with do_switch",
+    r"Successfully followed parent",
+    r"Checking svn:mergeinfo changes since r.*",
+    r"W: svn cherry-pick ignored .*",
+]
+
+# Compile all patterns once at import time, into a single alternation,
+# so the output is filtered in one pass, with one regex call per line
+_IGNORE_LINES_REGEX = re.compile("|".join(f"(?:{pattern})" for pattern in _IGNORE_LINES_PATTERNS), re.IGNORECASE)
+
+# Prefixes of the most common ignored lines, in order of how often they're seen,
+# checked with str.startswith before the regex, as they're the vast majority of the output of large fetches
+# These lines also match _IGNORE_LINES_REGEX, this only skips the regex call for them
+_IGNORE_LINES_PREFIXES = (
+    "\tA\t",
+    "\tM\t",
+    "Checked through r",
+    "\tD\t",
+)
+
+
+def _is_git_svn_fetch_output_line_kept(line: str) -> bool:
     """
+    Check if a line from the git svn fetch output could be a problem, for cmd.run_subprocess' output_filter
+    Keep _IGNORE_LINES_PATTERNS tidy, as every pattern is tried against every line of git_svn_fetch_output
 
-    if not git_svn_fetch_output:
-        return []
-
-    # log(ctx, f"before len(git_svn_fetch_output): {len(git_svn_fetch_output)}")
+    Returns False for empty lines, and lines which are known to not be problems
+    """
 
-    ## Check for any errors in the command output
     # Note: git_svn_fetch_output can be very long, "output_line_count": 309940
-
-    # Shorten the number of lines in the git svn output,
-    # by removing lines which we know are not errors / may be false positives
-    # Sort in order from most lines in typical output to least, to remove the most lines earliest
-    ignore_lines = [
-        r"\\tA\\t.*",                       # "\tA\tdir/file.ext",          # Add a new file
-        r"\\tM\\t.*",                       # "\tM\tdir/file.ext",          # Modify a file
-        r"r[0-9]+ = .*",                    # r[rev] = [hash] (refs/remotes/origin/tags/[tag])
-        r"Checked through r[0-9]+",         # "Checked through r123456"     # Many of the lines
-        r"\\tD\\t.*",                       # "\tD\tdir/file.ext",          # Delete a file
-        r"W: \+empty_dir: .*",
-        r"W: -empty_dir: .*",
-        r"Index mismatch: \w+ != \w+",
-        r"rereading \w+",
-        r"W: Ignoring error from SVN.*",    # "W: Ignoring error from SVN, path probably does not exist: (160013): Filesystem has no item: File not found..."
-        r"Auto packing the repository in background for optimum performance.",
-        r"See \\\"git help gc\\\" for manual housekeeping.",
-        r"Authentication realm: .*",
-        r"Password for '.*':",
-        r"This may take a while on large repositories",
-        r"W: Do not be alarmed at the above message git-svn is just searching aggressively for old history.",
-        r"branch_from: .*",
-        r"Found possible branch point: .*",
-        r"Initializing parent: .*",
-        r"Found branch parent: .*",
-        r"Following parent with do_switch",
-        r"Successfully followed parent",
-        r"Checking svn:mergeinfo changes since r.*",
-        r"W: svn cherry-pick ignored .*",
+    # Drop the most common ignored lines by their prefixes first, so only the rest need a regex call
+    return bool(
+        line
+        and not line.startswith(_IGNORE_LINES_PREFIXES)
+        and not _IGNORE_LINES_REGEX.search(line)
+    )
+
+
+# Dicts of lists of regex patterns
+# Be sure to escape any special characters needed in this list
+# Matched with .search(), so they can match anywhere in a line
+_ERROR_MESSAGE_REGEX_PATTERNS = {
+    "Timeout": [
+        "Connection timed out",
+    ],
+    "SSL/TLS": [
+        "SSL handshake failed",
+        "Server SSL certificate verification failed",
+    ],
+    "Connectivity": [
+        "Connection refused",
+        "Can't create session",
+        "Unable to connect to a repository",
+        "SVN connection failed somewhere",
+        "Invalid repository URL",
+        "Repository not found",
+    ],
+    "auth": [
+        "Authentication failed",
+        "Authorization failed",
+        "Invalid credentials",
+        "Permission denied",
+        "cannot fetch directory .*? not authorized",
+    ],
+    "repo config": [
+        "SVN repository location required as a command-line argument",
+        "Unable to determine upstream SVN information from working tree history",
+        "svn-remote .*? unknown",
+        "svn-remote .*? not defined",
+        "Failed to read .*? in config",
+    ],
+    "data integrity": [
+        "Last fetched revision of .*? but we are about to fetch",
+        "was not found in commit",
+        "Cannot find SVN revision",
+        "Checksum mismatch",
+        "Failed to read object",
+        "Failed to strip path",
+    ],
+    "local system": [
+        "Too many open files",
+        "No space left on device",
+        "Path not found",
+        "Repository is locked",
+        "Working copy locked",
+        "Couldn't unlink index",
+        "Failed to open .*? for writing",
+        "Failed to close",
+    ],
+    "other": [
+        "Error running context",
+        "Error from SVN",
+        "svn: E",
+        "Author: .*? not defined in .*? file",
+        "failed with exit code",
+        "useSvmProps set, but failed to read SVM properties",
+        "useSvnsyncProps set, but failed to read svnsync property",
+        "abort:",
+        "error:",
+        "fatal:",
+        " at /usr/share/perl5/Git/SVN/Ra.pm line ",
     ]
-
-    # Compile regex patterns for efficiency
-    ignore_lines_compiled_regexes   = []
-
-    for ignore_line in ignore_lines:
-
-        compiled_regex              = re.compile(ignore_line, re.IGNORECASE)
-        ignore_lines_compiled_regexes.append((ignore_line, compiled_regex))
-
-    # Remove the ignored lines, and empty lines from the output list
-    for ignore_line, compiled_regex in ignore_lines_compiled_regexes:
-
-        git_svn_fetch_output        = [line for line in git_svn_fetch_output if line and not compiled_regex.search(line)]
-
-    return git_svn_fetch_output
+}
+
+# Compile all categories once at import time, into a single anchored alternation,
+# with one numbered group per category, so each line is checked with one regex call instead of one per category
+# The lazy .*? prefix inside each group keeps the dict order priority between categories,
+# as the engine exhausts each category across the whole line before trying the next one
+_ERROR_MESSAGE_GROUP_CATEGORIES = {f"category_{i}": error_category for i, error_category in enumerate(_ERROR_MESSAGE_REGEX_PATTERNS)}
+_ERROR_MESSAGE_REGEX = re.compile(
+    "^(?:" + "|".join(
+        f"(?P<category_{i}>.*?(?:" + "|".join(patterns) + "))"
+            for i, patterns in enumerate(_ERROR_MESSAGE_REGEX_PATTERNS.values())
+    ) + ")",
+    re.IGNORECASE
+)
+
+# The longest literal substring of each pattern, lowercased,
+# as a line can only match a pattern if it contains that pattern's literal substring
+# Checking these with `in` is much faster than running the regex, and most lines don't contain any of them,
+# so they can skip _ERROR_MESSAGE_REGEX without any false negatives
+_ERROR_MESSAGE_LITERALS = tuple(sorted({
+    max(re.split(r"[.\\^$*+?{}\[\]|()]", pattern), key=len).lower()
+        for patterns in _ERROR_MESSAGE_REGEX_PATTERNS.values()
+        for pattern in patterns
+}))
+
+
+# Lines longer than this are skipped by the error scan, and kept in the remaining output
+# Real error messages are short, the long lines are file lists, diffs, and commit messages
+_ERROR_SCAN_MAX_LINE_LENGTH = 10000
+
+# Stop scanning output for errors after this many are found
+# The job's result only depends on whether there were any errors, the rest are only for debugging
+_ERROR_SCAN_MAX_ERRORS      = 100
 
 
 def _find_errors_in_svn_output(ctx: Context, svn_output: list = []) -> list:
     """
     Check for expected error messages
-    Keep this list tidy, as execution time is len(error_messages) x len(svn_output)
+    Keep _ERROR_MESSAGE_REGEX_PATTERNS tidy, as every pattern is tried against every line of svn_output
     """
 
     if not svn_output:
@@ -1173,96 +1735,52 @@ def _find_errors_in_svn_output(ctx: Context, svn_output: list = []) -> list:
 
     errors = []
 
-    # Dicts of lists of regex patterns
-    # Be sure to escape any special characters needed in this list
-    # These strings get .* added both before and after
-    error_message_regex_patterns_dict = {
-        "Timeout": [
-            "Connection timed out",
-        ],
-        "SSL/TLS": [
-            "SSL handshake failed",
-            "Server SSL certificate verification failed",
-        ],
-        "Connectivity": [
-            "Connection refused",
-            "Can't create session",
-            "Unable to connect to a repository",
-            "SVN connection failed somewhere",
-            "Invalid repository URL",
-            "Repository not found",
-        ],
-        "auth": [
-            "Authentication failed",
-            "Authorization failed",
-            "Invalid credentials",
-            "Permission denied",
-            "cannot fetch directory .* not authorized",
-        ],
-        "repo config": [
-            "SVN repository location required as a command-line argument",
-            "Unable to determine upstream SVN information from working tree history",
-            "svn-remote .* unknown",
-            "svn-remote .* not defined",
-            "Failed to read .* in config",
-        ],
-        "data integrity": [
-            "Last fetched revision of .* but we are about to fetch",
-            "was not found in commit",
-            "Cannot find SVN revision",
-            "Checksum mismatch",
-            "Failed to read object",
-            "Failed to strip path",
-        ],
-        "local system": [
-            "Too many open files",
-            "No space left on device",
-            "Path not found",
-            "Repository is locked",
-            "Working copy locked",
-            "Couldn't unlink index",
-            "Failed to open .* for writing",
-            "Failed to close",
-        ],
-        "other": [
-            "Error running context",
-            "Error from SVN",
-            "svn: E",
-            "Author: .* not defined in .* file",
-            "failed with exit code",
-            "useSvmProps set, but failed to read SVM properties",
-            "useSvnsyncProps set, but failed to read svnsync property",
-            "abort:",
-            "error:",
-            "fatal:",
-            " at /usr/share/perl5/Git/SVN/Ra.pm line ",
-        ]
-    }
+    # Single pass through output lines, with one regex call per line,
+    # sorting each line into either errors or remaining_output, so the output isn't iterated twice
+    matched_lines       = set()  # Track matched lines to avoid duplicates
+    remaining_output    = []
+    long_line_count     = 0
+    for line_index, line in enumerate(svn_output):
+
+        # Stop scanning once we've found enough errors to debug with,
+        # and keep the unscanned lines in the remaining output
+        if len(errors) >= _ERROR_SCAN_MAX_ERRORS:
+            log(ctx, f"Found {_ERROR_SCAN_MAX_ERRORS} errors, skipping the remaining {len(svn_output) - line_index} lines of output", "warning")
+            remaining_output.extend(svn_output[line_index:])
+            break
+
+        # Don't spend the scan on very long lines, which are never actionable errors
+        if len(line) > _ERROR_SCAN_MAX_LINE_LENGTH:
+            long_line_count += 1
+            remaining_output.append(line)
+            continue
 
-    # Compile all regex patterns once for efficiency
-    compiled_patterns = []
-    for error_category, patterns in error_message_regex_patterns_dict.items():
-        for pattern in patterns:
-            regex_pattern = rf".*{pattern}.*"
-            compiled_regex = re.compile(regex_pattern, re.IGNORECASE)
-            compiled_patterns.append((error_category, compiled_regex))
-
-    # Single pass through output lines - O(lines x patterns)
-    matched_lines = set()  # Track matched lines to avoid duplicates
-    for line in svn_output:
-        if line in matched_lines:
+        # Fast path for lines which can't match any error pattern
+        line_lower = line.lower()
+        if not any(literal in line_lower for literal in _ERROR_MESSAGE_LITERALS):
+            remaining_output.append(line)
             continue
 
-        for error_category, compiled_regex in compiled_patterns:
-            if compiled_regex.search(line):
-                errors.append(f"Error message: {error_category}: {line}")
-                matched_lines.add(line)
-                break  # Stop checking other patterns for this line
+        match = _ERROR_MESSAGE_REGEX.match(line)
+        if match:
+
+            # Only check for duplicates after a match, so only the few matched lines are hashed,
+            # a duplicate of a matched line always matches too
+            if line in matched_lines:
+                continue
+
+            error_category = _ERROR_MESSAGE_GROUP_CATEGORIES[match.lastgroup]
+            errors.append(f"Error message: {error_category}: {line}")
+            matched_lines.add(line)
+        else:
+            remaining_output.append(line)
 
-    # Remove the matched lines from the output
-    remaining_output = [line for line in svn_output if line not in matched_lines]
+    if long_line_count:
+        log(ctx, f"Skipped {long_line_count} lines longer than {_ERROR_SCAN_MAX_LINE_LENGTH} characters while scanning output for errors", "debug")
 
+    # Store only a truncated copy of the remaining output in the job dict,
+    # as the job dict is kept for the life of the job, and logged with every event
     if remaining_output:
-        ctx.job["result"]["remaining_output"] = remaining_output
+        ctx.job["result"]["remaining_output"] = cmd.truncate_output(ctx, remaining_output)
 
     return errors
@@ -8,8 +8,12 @@ from utils import lockfiles
 
 # Import Python standard modules
 from datetime import datetime, timedelta
-from typing import Union, Optional, Dict, Any, List
+from typing import Union, Optional, Dict, Any, List, Tuple, Callable
+import collections
+import functools
 import os
+import resource
+import shutil
 import subprocess
 import textwrap
 import uuid
@@ -47,6 +51,30 @@ def get_pid_uptime(pid: int = 1) -> Optional[timedelta]:
     return pid_uptime
 
 
+def get_running_processes() -> List[tuple]:
+    """
+    Get the pid and command line args of each running process in the container
+
+    Called by other modules
+
+    Reads /proc through psutil, instead of forking a ps subprocess
+
+    Returns:
+        List of (pid, args) tuples, with args joined into a single string, like ps' args column
+        Processes without a command line, ex. kernel threads and zombies, are skipped
+    """
+
+    running_processes = []
+
+    for process in psutil.process_iter(["pid", "cmdline"], ad_value=None):
+
+        cmdline = process.info.get("cmdline")
+        if cmdline:
+            running_processes.append((process.info["pid"], " ".join(cmdline)))
+
+    return running_processes
+
+
 def _get_process_metadata(ctx: Context, process: psutil.Process) -> Dict:
     """
     Read and reformat the data returned by psutils.as_dict()
@@ -222,17 +250,49 @@ def log_process_status(
     log(ctx, status_message, log_level, structured_log_dict, exception=exception)
 
 
+def raise_open_files_limit(ctx: Context) -> None:
+    """
+    Raise this process' soft limit on open file descriptors up to its hard limit
+
+    Called once at container startup, so the limit is inherited by all child processes,
+    as git svn fetch, git gc, and deleting large repos can open many files at once
+    """
+
+    try:
+
+        soft_limit, hard_limit = resource.getrlimit(resource.RLIMIT_NOFILE)
+
+        if soft_limit != hard_limit:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (hard_limit, hard_limit))
+            log(ctx, f"Raised open files limit from {soft_limit} to {hard_limit}", "debug")
+
+    except (ValueError, OSError) as e:
+        log(ctx, "Failed to raise open files limit", "warning", exception=e)
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_executable(name: str) -> Optional[str]:
+    """
+    Resolve a command name to its absolute path on the PATH, once per process
+
+    subprocess only uses posix_spawn instead of fork + exec when the executable has a directory in its path
+    """
+
+    return shutil.which(name)
+
+
 def run_subprocess(
-        ctx:        Context,
-        args:       Union[str, List[str]],
-        password:   Optional[str]           = "",
-        quiet:      Optional[bool]          = False,
-        name:       Optional[str]           = "",
-        stderr:     Optional[str]           = "stdout",
+        ctx:            Context,
+        args:           Union[str, List[str], Tuple[str, ...]],
+        password:       Optional[str]                       = "",
+        quiet:          Optional[bool]                      = False,
+        name:           Optional[str]                       = "",
+        stderr:         Optional[str]                       = "stdout",
+        output_filter:  Optional[Callable[[str], bool]]     = None,
     ) -> Dict[str, Any]:
     """
     Middleware function to
-    - Take a CLI command as an args string or list of strings
+    - Take a CLI command as an args string, or list or tuple of strings
     - Execute it as a subprocess
     - Wait for the subprocess to complete
     - Gather the needed command output and metadata
@@ -240,7 +300,7 @@ def run_subprocess(
 
     Args:
         ctx: Context object
-        args: Command arguments as string or list
+        args: Command arguments as string, list, or tuple
         password: Password to be prefilled into stdin stream buffer
         quiet: Suppress non-error logging
         name: Optional command name to make logging events easier to find
@@ -248,6 +308,11 @@ def run_subprocess(
             "stdout" (default), stderr stream is redirected to stdout stream
             "ignore", stderr stream is redirected to /dev/null
             "stderr", stderr stream is stored at return_dict["stderr"]
+        output_filter: Optional function, called with each line of stdout,
+            only lines it returns True for are kept in return_dict["output"],
+            so callers which only need a few lines of a long output don't hold onto all of it
+            stdout is read and filtered line by line as the process runs, so the full output is never held in memory,
+            unless stderr="stderr", where both pipes need to be drained together, so the output is filtered after it's captured
 
     Notes:
         Use log_process_status() in this function, to format and print process stats
@@ -270,7 +335,7 @@ def run_subprocess(
 
 
     # Normalize args as a string for log output
-    if isinstance(args, list):
+    if isinstance(args, (list, tuple)):
         subprocess_dict["args"] = " ".join(args)
     elif isinstance(args, str):
         subprocess_dict["args"] = args
@@ -306,12 +371,22 @@ def run_subprocess(
         # Create the process object and start it
         # Do not raise an exception on process failure
         # TODO: Disable text = True, and handle stdin / out / err pipes as byte streams, so that stdout can be checked without waiting for a newline
+        # Resolve the executable's absolute path,
+        # so subprocess can use posix_spawn (vfork) instead of fork,
+        # which avoids copying this process' page tables for every command
+        # Keep close_fds=True, newer CPython versions can still use posix_spawn with it, closing fds via close_range
+        executable = None
+        if isinstance(args, (list, tuple)) and args:
+            executable = _resolve_executable(args[0])
+
         sub_process = psutil.Popen(
-            args    = args,
-            stderr  = stderr_int,
-            stdin   = subprocess.PIPE,
-            stdout  = subprocess.PIPE,
-            text    = True,
+            args        = args,
+            close_fds   = True,
+            executable  = executable,
+            stderr      = stderr_int,
+            stdin       = subprocess.PIPE,
+            stdout      = subprocess.PIPE,
+            text        = True,
         )
 
         subprocess_dict["status_message"] = "started"
@@ -362,27 +437,41 @@ def run_subprocess(
         std_out_list = []
         std_out_string = ""
 
-        if password:
+        if output_filter and stderr_int != subprocess.PIPE:
 
-            # If password is provided to this function,
-            # feed the password string into the subprocess' stdin pipe;
-            # password could be an empty or arbitrary string as a workaround if a process needed it
-            # communicate() also waits for the process to finish
-            std_out_string, std_err_string = sub_process.communicate(password)
+            # Read and filter stdout line by line, which also waits for the process to finish
+            (
+                std_out_list,
+                subprocess_dict["output_line_count"],
+                subprocess_dict["truncated_output"],
+            )                                   = _read_filtered_output(ctx, sub_process, password, output_filter)
 
         else:
 
-            # communicate() waits for the process to finish
-            std_out_string, std_err_string = sub_process.communicate()
+            if password:
+
+                # If password is provided to this function,
+                # feed the password string into the subprocess' stdin pipe;
+                # password could be an empty or arbitrary string as a workaround if a process needed it
+                # communicate() also waits for the process to finish
+                std_out_string, std_err_string = sub_process.communicate(password)
+
+            else:
+
+                # communicate() waits for the process to finish
+                std_out_string, std_err_string = sub_process.communicate()
 
 
-        # Get the process' stdout and/or stderr
-        # Have to do this inside the try / except block, in case the output isn't valid
-        std_out_list                            += std_out_string.splitlines()
+            # Get the process' stdout and/or stderr
+            # Have to do this inside the try / except block, in case the output isn't valid
+            std_out_list                            += std_out_string.splitlines()
+            subprocess_dict["output_line_count"]    = len(std_out_list)
+            # Truncate the output for logging, before it's filtered, so it matches output_line_count
+            subprocess_dict["truncated_output"]     = truncate_output(ctx, std_out_list)
+            if output_filter:
+                std_out_list                        = [line for line in std_out_list if output_filter(line)]
+
         subprocess_dict["output"]               = std_out_list
-        subprocess_dict["output_line_count"]    = len(std_out_list)
-        # Truncate the output for logging
-        subprocess_dict["truncated_output"]     = truncate_output(ctx, std_out_list)
 
         if "stderr" in stderr:
             std_err_list                            += std_err_string.splitlines()
@@ -566,7 +655,57 @@ def status_update_and_cleanup_zombie_processes(ctx: Context) -> None:
         log_process_status(ctx, subprocess_psutils_dict, subprocess_dict)
 
 
-def truncate_output(ctx, output: List[str]) -> List[str]:
+def _read_filtered_output(
+        ctx:            Context,
+        sub_process:    psutil.Popen,
+        password:       Optional[str],
+        output_filter:  Callable[[str], bool],
+    ) -> Tuple[List[str], int, List[str]]:
+    """
+    Read a subprocess' stdout line by line until it closes, then wait for the process to finish,
+    keeping only the lines output_filter returns True for,
+    and the first and last TRUNCATED_OUTPUT_MAX_LINES non-empty lines, for truncate_output
+
+    Only used when stderr isn't a separate pipe, otherwise the process could block writing to a full stderr pipe
+
+    Returns the kept lines, the count of all lines, and the truncated output for logging
+    """
+
+    truncated_output_max_lines  = ctx.env_vars["TRUNCATED_OUTPUT_MAX_LINES"]
+    output: List[str]           = []
+    output_line_count           = 0
+    first_lines: List[str]      = []
+    last_lines                  = collections.deque(maxlen=truncated_output_max_lines)
+
+    # Feed the password into stdin, then close it, the same as communicate() does
+    try:
+        if password:
+            sub_process.stdin.write(password)
+        sub_process.stdin.close()
+    except BrokenPipeError:
+        pass
+
+    for line in sub_process.stdout:
+
+        line                = line.rstrip("\n")
+        output_line_count   += 1
+
+        if line:
+            if len(first_lines) < truncated_output_max_lines:
+                first_lines.append(line)
+            else:
+                last_lines.append(line)
+
+        if output_filter(line):
+            output.append(line)
+
+    sub_process.stdout.close()
+    sub_process.wait()
+
+    return output, output_line_count, truncate_output(ctx, [*first_lines, *last_lines], output_line_count)
+
+
+def truncate_output(ctx, output: List[str], output_line_count: Optional[int] = None) -> List[str]:
     """
     Truncate subprocess output to prevent excessively long log entries.
 
@@ -577,6 +716,7 @@ def truncate_output(ctx, output: List[str]) -> List[str]:
 
     Args:
         output: List of output lines from subprocess
+        output_line_count: Count of all output lines, if output only holds the first and last lines of it
 
     Returns:
         List of truncated output lines with truncation notices if applicable
@@ -589,7 +729,7 @@ def truncate_output(ctx, output: List[str]) -> List[str]:
     truncated_output: List[str] = []
 
     # Truncate the number of lines
-    subprocess_output_lines     = len(output)
+    subprocess_output_lines     = len(output) if output_line_count is None else output_line_count
     truncated_output_max_lines  = ctx.env_vars["TRUNCATED_OUTPUT_MAX_LINES"]
 
     if subprocess_output_lines <= truncated_output_max_lines:
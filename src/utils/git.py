@@ -309,7 +309,7 @@ def get_config(ctx: Context, key: str, config_file_path: str = "", quiet: bool=F
 
     if result["return_code"] == 0:
 
-        value = list(result.get("output",""))
+        value = result.get("output") or []
         # log(ctx, f"git.get_config succeeded; key: {key}; value: {value}; cmd_git_get_config: {cmd_git_get_config}; result: {value}", "info")
 
     else:
@@ -320,6 +320,48 @@ def get_config(ctx: Context, key: str, config_file_path: str = "", quiet: bool=F
     return value
 
 
+def get_all_config(ctx: Context, config_file_path: str = "", quiet: bool=False) -> dict:
+    """
+    Get all config keys and values from a repo's config file, in one git command,
+    to avoid running a git config --get subprocess for each key
+
+    Keys are returned in the lowercase form git config --list prints them in,
+    so lookup keys need to be lowercased too, ex. "svn.authorsprog"
+    If a key is set more than once, the last value wins, same as git config --get
+    """
+
+    # Validate if the config_file_path exists, but do not use it
+    if config_file_path and not _get_and_validate_local_repo_path(ctx, sub_dir=config_file_path, quiet=quiet):
+        return {}
+
+    local_repo_path = _get_and_validate_local_repo_path(ctx, quiet=quiet)
+    if not local_repo_path:
+        return {}
+
+    cmd_git_get_all_config = ["git", "-C", local_repo_path, "config"]
+
+    if config_file_path:
+        cmd_git_get_all_config += ["--file", config_file_path]
+
+    # -z terminates each entry with a NUL, and separates keys from values with a newline,
+    # so values containing newlines are still parsed correctly
+    cmd_git_get_all_config += ["--list", "-z"]
+
+    config = {}
+    result = cmd.run_subprocess(ctx, cmd_git_get_all_config, quiet=True, name="cmd_git_get_all_config")
+
+    if result["return_code"] == 0:
+
+        # run_subprocess splits the output into lines, so join them back together before splitting on the NULs
+        for entry in "\n".join(result.get("output") or []).split("\0"):
+
+            key, _, value = entry.lstrip("\n").partition("\n")
+            if key:
+                config[key] = value
+
+    return config
+
+
 def get_latest_commit_metadata(ctx: Context, commit_metadata_field_list: list[str] = None) -> list:
     """
     Get metadata from the most recent commit from the local git repo
@@ -369,7 +411,7 @@ def get_latest_commit_metadata(ctx: Context, commit_metadata_field_list: list[st
 
     if result["return_code"] == 0:
 
-        commit_metadata_return_list = list(result.get("output",""))
+        commit_metadata_return_list = result.get("output") or []
         # log(ctx, f"git.get_latest_commit_metadata succeeded; result: {commit_metadata_return_list}", "info")
 
     else:
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-# Try to clear the various lock files left behind by different processes
+# Try to clear the various lock files, and deleted repo dirs, left behind by different processes
 # TODO: Move to git module
 
 # Import repo-converter modules
@@ -12,14 +12,67 @@ import os
 import subprocess
 
 
+# Invalid repos are moved into this dir under SRC_SERVE_ROOT, then deleted in the background
+# The paths in this dir don't include the repo's path, so the rm -rf processes deleting them
+# don't match another job's concurrency check for the same repo
+_REPO_TRASH_DIR_NAME = ".repo-converter-trash"
+
+
+def get_repo_trash_dir_path(ctx: Context) -> str:
+    """
+    Get the path to the dir invalid repos are moved into before they're deleted
+    """
+
+    return os.path.join(ctx.env_vars["SRC_SERVE_ROOT"], _REPO_TRASH_DIR_NAME)
+
+
+def delete_in_background(paths: list) -> None:
+    """
+    Delete paths with rm -rf, in a background process, in its own session,
+    so it keeps running in parallel with the caller, and after the caller exits
+    """
+
+    subprocess.Popen(
+        ["rm", "-rf", *paths],
+        start_new_session   = True,
+        stdin               = subprocess.DEVNULL,
+        stdout              = subprocess.DEVNULL,
+        stderr              = subprocess.DEVNULL,
+    )
+
+
+def clear_repo_trash(ctx: Context) -> None:
+    """
+    Delete any repo dirs left in the trash dir, ex. if the container restarted, or the rm -rf was killed, before they were deleted
+
+    Called once at container startup, before any conversion jobs are started, so none of them are still being deleted
+    """
+
+    repo_trash_dir_path = get_repo_trash_dir_path(ctx)
+
+    try:
+        with os.scandir(repo_trash_dir_path) as dir_entries:
+            paths_to_delete = [dir_entry.path for dir_entry in dir_entries]
+    except FileNotFoundError:
+        return
+    except OSError as e:
+        log(ctx, f"Failed to read repo trash dir {repo_trash_dir_path}", "warning", exception=e)
+        return
+
+    if paths_to_delete:
+        log(ctx, f"Deleting {len(paths_to_delete)} repo dirs left in {repo_trash_dir_path} in the background", "info")
+        delete_in_background(paths_to_delete)
+
+
 def clear_lock_files(ctx: Context) -> bool:
     """
     Check for the most common lockfiles and try to remove them, when a repo clone job fails
     """
 
     # Get the local repo path
-    local_repo_path = ctx.job.get("config", {}).get("local_repo_path","")
-    repo_key        = ctx.job.get("config", {}).get("repo_key","")
+    job_config      = ctx.job["config"]
+    local_repo_path = job_config.get("local_repo_path","")
+    repo_key        = job_config.get("repo_key","")
 
     if not local_repo_path:
         log(ctx, f"No local_repo_path", "error")
@@ -17,6 +17,16 @@ import traceback
 import structlog
 
 
+# Numeric values of the log level names, in the same order as the standard library's logging levels
+_LOG_LEVEL_VALUES = {
+    "DEBUG":    10,
+    "INFO":     20,
+    "WARNING":  30,
+    "ERROR":    40,
+    "CRITICAL": 50,
+}
+
+
 def log(
         ctx: Context,
         message: str,
@@ -40,9 +50,16 @@ def log(
 
     # Normalize level name
     event_log_level_name = str(event_log_level_name).upper()
-    if event_log_level_name not in ["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"]:
+    if event_log_level_name not in _LOG_LEVEL_VALUES:
         event_log_level_name = "DEBUG"
 
+    # Return early if the event is below the configured log level,
+    # before building the payload, capturing the stack, and redacting secrets, which structlog would only discard
+    # Defaults to INFO, the same as logger.configure
+    configured_log_level_value = _LOG_LEVEL_VALUES.get(str(ctx.env_vars.get("LOG_LEVEL", "INFO")).upper(), _LOG_LEVEL_VALUES["INFO"])
+    if _LOG_LEVEL_VALUES[event_log_level_name] < configured_log_level_value:
+        return
+
     # Get structlog logger
     logger = structlog.get_logger()
 
@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+# Shared pytest setup for repo-converter tests
+
+# Import Python standard modules
+import os
+import sys
+import types
+
+# The container runs src/main.py with src/ as the working dir, so modules import each other from there
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+# pysvn isn't on PyPI, it's built from source in the container image
+# If it's not installed, provide the few names source_repo.svn references at import time,
+# the tests don't call the svn server
+try:
+    import pysvn # noqa: F401
+except ImportError:
+
+    pysvn_stub                  = types.ModuleType("pysvn")
+    pysvn_stub.Client           = type("Client", (), {})
+    pysvn_stub.ClientError      = type("ClientError", (Exception,), {})
+    sys.modules["pysvn"]        = pysvn_stub
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# Tests for utils/cmd.py
+
+# Import repo-converter modules
+from utils import cmd
+from utils.context import Context, NestedDefaultDict
+
+# Import Python standard modules
+import pytest
+
+
+@pytest.fixture
+def ctx():
+    """Context with a fresh job dict, logging only errors"""
+
+    ctx         = Context({
+        "LOG_LEVEL":                        "ERROR",
+        "TRUNCATED_OUTPUT_MAX_LINE_LENGTH": 200,
+        "TRUNCATED_OUTPUT_MAX_LINES":       11,
+    })
+    ctx.job     = NestedDefaultDict()
+
+    return ctx
+
+
+# Prints the password read from stdin, then numbered lines, with an empty line in the middle
+_ARGS_PRINT_LINES = ["sh", "-c", 'read password; echo "password $password"; seq 1 50; echo; seq 51 100']
+
+
+def _is_multiple_of_ten(line):
+    return line.isdigit() and int(line) % 10 == 0
+
+
+def test_run_subprocess_output_filter(ctx):
+
+    result = cmd.run_subprocess(ctx, _ARGS_PRINT_LINES, "secret", quiet=True, output_filter=_is_multiple_of_ten)
+
+    assert result["success"] is True
+    assert result["output"] == [str(i) for i in range(10, 101, 10)]
+    assert result["output_line_count"] == 102
+
+
+def test_run_subprocess_output_filter_matches_unfiltered_truncated_output(ctx):
+
+    unfiltered_result   = cmd.run_subprocess(ctx, _ARGS_PRINT_LINES, "secret", quiet=True)
+    filtered_result     = cmd.run_subprocess(ctx, _ARGS_PRINT_LINES, "secret", quiet=True, output_filter=_is_multiple_of_ten)
+
+    assert unfiltered_result["output"][0] == "password secret"
+    assert filtered_result["output_line_count"] == unfiltered_result["output_line_count"]
+    assert filtered_result["truncated_output"] == unfiltered_result["truncated_output"]
+
+
+def test_run_subprocess_output_filter_short_output(ctx):
+
+    result = cmd.run_subprocess(ctx, ["sh", "-c", "echo 10; echo; echo 11"], quiet=True, output_filter=_is_multiple_of_ten)
+
+    assert result["output"] == ["10"]
+    assert result["output_line_count"] == 3
+    assert result["truncated_output"] == ["10", "11"]
+
+
+def test_run_subprocess_output_filter_with_separate_stderr(ctx):
+
+    result = cmd.run_subprocess(ctx, ["sh", "-c", "seq 1 20; echo error >&2"], quiet=True, stderr="stderr", output_filter=_is_multiple_of_ten)
+
+    assert result["output"] == ["10", "20"]
+    assert result["stderr"] == ["error"]
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# Tests for utils/lockfiles.py
+
+# Import repo-converter modules
+from utils import lockfiles
+from utils.context import Context
+
+# Import Python standard modules
+from unittest import mock
+import os
+
+
+def test_repo_trash_dir_path_does_not_contain_repo_paths(tmp_path):
+
+    ctx                 = Context({"LOG_LEVEL": "ERROR", "SRC_SERVE_ROOT": str(tmp_path)})
+    local_repo_path     = os.path.join(str(tmp_path), "svn.example.com", "repo")
+
+    assert local_repo_path not in lockfiles.get_repo_trash_dir_path(ctx)
+
+
+def test_clear_repo_trash_deletes_leftover_dirs(tmp_path):
+
+    ctx                 = Context({"LOG_LEVEL": "ERROR", "SRC_SERVE_ROOT": str(tmp_path)})
+    repo_trash_dir_path = lockfiles.get_repo_trash_dir_path(ctx)
+    os.makedirs(os.path.join(repo_trash_dir_path, "123.456"))
+
+    with mock.patch.object(lockfiles, "delete_in_background") as delete_in_background:
+        lockfiles.clear_repo_trash(ctx)
+
+    delete_in_background.assert_called_once_with([os.path.join(repo_trash_dir_path, "123.456")])
+
+
+def test_clear_repo_trash_without_trash_dir(tmp_path):
+
+    ctx                 = Context({"LOG_LEVEL": "ERROR", "SRC_SERVE_ROOT": str(tmp_path)})
+
+    with mock.patch.object(lockfiles, "delete_in_background") as delete_in_background:
+        lockfiles.clear_repo_trash(ctx)
+
+    delete_in_background.assert_not_called()
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# Tests for source_repo/svn.py
+
+# Import repo-converter modules
+from source_repo import svn
+from utils.context import Context, NestedDefaultDict
+
+# Import Python standard modules
+from types import SimpleNamespace
+from unittest import mock
+import pytest
+
+
+@pytest.fixture
+def ctx():
+    """Context with a fresh job dict, logging only errors"""
+
+    ctx         = Context({
+        "LOG_LEVEL":                        "ERROR",
+        "TRUNCATED_OUTPUT_MAX_LINE_LENGTH": 200,
+        "TRUNCATED_OUTPUT_MAX_LINES":       11,
+    })
+    ctx.job     = NestedDefaultDict()
+    ctx.job["config"].update({
+        "local_repo_path":  "/tmp/repo-converter-test-repo",
+        "log_window_size":  100,
+        "max_retries":      5,
+    })
+
+    return ctx
+
+
+def _run_git_svn_fetch(ctx, commits_added_per_try):
+    """
+    Run _git_svn_fetch with every external command mocked out,
+    where each try fails, and adds the next number of commits from commits_added_per_try
+
+    Returns the fetch's return value, and the log_window_size of each try run
+    """
+
+    log_window_sizes = []
+
+    def fake_check_git_svn_fetch_success(ctx, git_svn_fetch_result):
+        tries_attempted = git_svn_fetch_result["tries_attempted"]
+        ctx.job["stats"]["local"][f"git_commit_count_added_try_{tries_attempted}"] = commits_added_per_try[tries_attempted - 1]
+        log_window_sizes.append(ctx.job["config"]["log_window_size"])
+        return False
+
+    with (
+        mock.patch.object(svn, "_check_git_svn_fetch_success", fake_check_git_svn_fetch_success),
+        mock.patch.object(svn, "_get_git_svn_fetch_revision_range", return_value=""),
+        mock.patch.object(svn.cmd, "run_subprocess", return_value={"execution_time_seconds": 0}),
+        mock.patch.object(svn.git, "deduplicate_git_config_file"),
+        mock.patch.object(svn.git, "garbage_collection"),
+        mock.patch.object(svn.git, "cleanup_branches_and_tags"),
+        mock.patch.object(svn.lockfiles, "clear_lock_files"),
+        mock.patch.object(svn.time, "sleep"),
+    ):
+        result = svn._git_svn_fetch(ctx, svn.Commands([], [], ["git", "svn", "fetch"], []))
+
+    return result, log_window_sizes
+
+
+def test_git_svn_fetch_stops_early_without_progress(ctx):
+
+    result, log_window_sizes = _run_git_svn_fetch(ctx, [0, 0, 0, 0, 0])
+
+    assert result is False
+    assert len(log_window_sizes) == svn._MAX_TRIES_WITHOUT_PROGRESS
+
+
+def test_git_svn_fetch_without_progress_reaches_last_halved_try_at_default_max_retries(ctx):
+
+    ctx.job["config"]["max_retries"] = svn._REPO_CONFIG_DEFAULTS["max_retries"]
+
+    result, log_window_sizes = _run_git_svn_fetch(ctx, [0, 0, 0])
+
+    assert result is False
+    assert log_window_sizes == [100, 50, 25]
+
+
+def test_git_svn_fetch_negative_commit_count_is_not_progress(ctx):
+
+    result, log_window_sizes = _run_git_svn_fetch(ctx, [0, -5, 0, 0, 0])
+
+    assert result is False
+    assert len(log_window_sizes) == svn._MAX_TRIES_WITHOUT_PROGRESS
+
+
+def test_git_svn_fetch_progress_resets_the_circuit_breaker(ctx):
+
+    result, log_window_sizes = _run_git_svn_fetch(ctx, [0, 0, 3, 0, 0])
+
+    assert result is False
+    assert len(log_window_sizes) == 5
+
+
+def _get_git_svn_fetch_revision_range(ctx, git_svn_metadata, git_latest_commit_rev_begin=0, last_changed_rev=200):
+    """
+    Run _get_git_svn_fetch_revision_range with the given .git/svn/.metadata contents, as git config --list keys
+    """
+
+    ctx.job["stats"]["local"]["git_latest_commit_rev_begin"]    = git_latest_commit_rev_begin
+    ctx.job["stats"]["remote"]["last_changed_rev"]              = last_changed_rev
+
+    with mock.patch.object(svn.git, "get_all_config", return_value=git_svn_metadata):
+        return svn._get_git_svn_fetch_revision_range(ctx)
+
+
+def test_git_svn_fetch_revision_range(ctx):
+
+    git_svn_metadata = {
+        "svn-remote.svn.branches-maxrev":   "150",
+        "svn-remote.svn.tags-maxrev":       "150",
+    }
+
+    assert _get_git_svn_fetch_revision_range(ctx, git_svn_metadata, git_latest_commit_rev_begin=140) == "151:200"
+
+
+def test_git_svn_fetch_revision_range_empty_repo(ctx):
+
+    assert _get_git_svn_fetch_revision_range(ctx, {}) == ""
+
+
+def test_git_svn_fetch_revision_range_already_past_last_changed_rev(ctx):
+
+    git_svn_metadata = {
+        "svn-remote.svn.branches-maxrev":   "200",
+        "svn-remote.svn.tags-maxrev":       "200",
+    }
+
+    assert _get_git_svn_fetch_revision_range(ctx, git_svn_metadata, git_latest_commit_rev_begin=200) == ""
+
+
+def test_git_svn_fetch_revision_range_unparsable_max_rev(ctx):
+
+    git_svn_metadata = {
+        "svn-remote.svn.branches-maxrev":   "not a number",
+        "svn-remote.svn.tags-maxrev":       "150",
+    }
+
+    assert _get_git_svn_fetch_revision_range(ctx, git_svn_metadata) == ""
+
+
+def test_git_svn_fetch_revision_range_tags_behind_branches(ctx):
+
+    git_svn_metadata = {
+        "svn-remote.svn.branches-maxrev":   "150",
+        "svn-remote.svn.tags-maxrev":       "120",
+    }
+
+    assert _get_git_svn_fetch_revision_range(ctx, git_svn_metadata) == ""
+
+
+def test_git_svn_fetch_revision_range_without_last_changed_rev(ctx):
+
+    git_svn_metadata = {
+        "svn-remote.svn.branches-maxrev":   "150",
+        "svn-remote.svn.tags-maxrev":       "150",
+    }
+
+    assert _get_git_svn_fetch_revision_range(ctx, git_svn_metadata, last_changed_rev=0) == ""
+
+
+def test_convert_up_to_date_repo_skips_git_dir_size(ctx):
+
+    with (
+        mock.patch.object(svn, "_extract_repo_config_and_set_default_values"),
+        mock.patch.object(svn, "_build_cli_commands"),
+        mock.patch.object(svn, "_check_if_conversion_is_already_running_in_another_process", return_value=False),
+        mock.patch.object(svn, "_initialize_pysvn"),
+        mock.patch.object(svn, "_test_connection_and_credentials", return_value=True),
+        mock.patch.object(svn, "_check_if_repo_exists_locally", return_value=True),
+        mock.patch.object(svn, "_configure_git_repo"),
+        mock.patch.object(svn, "_check_if_repo_up_to_date", return_value=True),
+        mock.patch.object(svn, "_get_git_refs_fingerprint", return_value=""),
+        mock.patch.object(svn, "_get_git_dir_size") as mock_get_git_dir_size,
+        mock.patch.object(svn, "_git_svn_fetch") as mock_git_svn_fetch,
+        mock.patch.object(svn.git, "get_count_of_commits_in_repo", return_value=10),
+        mock.patch.object(svn.git, "get_latest_commit_metadata", return_value=[]),
+        mock.patch.object(svn.git, "get_config", return_value=[]),
+        mock.patch.object(svn.git, "garbage_collection"),
+        mock.patch.object(svn.git, "cleanup_branches_and_tags"),
+    ):
+        svn.convert(ctx)
+
+    mock_git_svn_fetch.assert_not_called()
+    mock_get_git_dir_size.assert_not_called()
+    assert ctx.job["stats"]["local"]["git_commit_count_end"] == 10
+
+
+def test_svn_info_cache_hit_restores_the_same_remote_stats(ctx, tmp_path):
+
+    repo_url = "https://svn.example.com/repos/project"
+
+    (tmp_path / ".git").mkdir()
+    ctx.job["config"].update({
+        "local_repo_path":              str(tmp_path),
+        "min_remote_recheck_seconds":   60,
+        "repo_url":                     repo_url,
+    })
+
+    pysvn_client = mock.Mock()
+    pysvn_client.info2.return_value = [("", SimpleNamespace(data={
+        "URL":                  repo_url,
+        "rev":                  SimpleNamespace(number=150),
+        "last_changed_rev":     SimpleNamespace(number=140),
+        "last_changed_date":    1753437840.0,
+    }))]
+
+    with (
+        mock.patch.object(svn, "pysvn"),
+        mock.patch.object(svn, "_get_cached_git_latest_commit_rev", return_value=140),
+    ):
+
+        # The first run connects to the svn server, and caches its results
+        assert svn._test_connection_and_credentials(ctx, pysvn_client) is True
+        uncached_remote_stats = dict(ctx.job["stats"]["remote"])
+
+        # The second run is served from the cache, without connecting to the svn server
+        ctx.job["stats"] = NestedDefaultDict()
+        pysvn_client.info2.reset_mock()
+        assert svn._test_connection_and_credentials(ctx, pysvn_client) is True
+
+    pysvn_client.info2.assert_not_called()
+    assert uncached_remote_stats["last_changed_date"]
+    assert dict(ctx.job["stats"]["remote"]) == uncached_remote_stats
+
+
+def test_git_svn_fetch_success_keeps_remaining_output_without_scanning_it(ctx):
+
+    ctx.job["stats"]["local"]["git_commit_count_begin"] = 10
+
+    git_svn_fetch_result = {
+        "output":           ["W: unrecognized line"],
+        "return_code":      0,
+        "tries_attempted":  1,
+    }
+
+    with (
+        mock.patch.object(svn, "_check_if_repo_exists_locally", return_value=True),
+        mock.patch.object(svn, "_get_local_git_repo_stats", return_value={"git_commit_count": 15}),
+        mock.patch.object(svn, "_find_errors_in_svn_output") as mock_find_errors_in_svn_output,
+    ):
+        assert svn._check_git_svn_fetch_success(ctx, git_svn_fetch_result) is True
+
+    mock_find_errors_in_svn_output.assert_not_called()
+    assert ctx.job["result"]["remaining_output"] == ["W: unrecognized line"]